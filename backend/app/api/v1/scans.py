@@ -2,7 +2,6 @@
 DPDP GUI Compliance Scanner - Scans API Routes
 """
 from typing import List, Optional
-import asyncio
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, WebSocket, WebSocketDisconnect, BackgroundTasks
@@ -10,8 +9,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import CurrentUser, DbSession
-from app.core.websocket import manager, websocket_subscriber, ScanProgress as WsScanProgress
-from app.core.config import settings
+from app.core.websocket import manager, ScanProgress as WsScanProgress
 from app.models.application import Application, ApplicationType
 from app.models.scan import Scan, ScanStatus, ScanType
 from app.models.finding import Finding
@@ -511,13 +509,9 @@ async def scan_progress_websocket(
     - completed: Scan finished
     - error: Error occurred
     """
+    # Events arrive through the shared scan_event_subscriber
     await manager.connect(websocket, str(scan_id))
 
-    # Start Redis subscriber for this scan
-    subscriber_task = asyncio.create_task(
-        websocket_subscriber(str(scan_id), settings.REDIS_URL)
-    )
-
     try:
         while True:
             # Keep connection alive by waiting for client messages
@@ -531,7 +525,6 @@ async def scan_progress_websocket(
     except WebSocketDisconnect:
         pass
     finally:
-        subscriber_task.cancel()
         await manager.disconnect(websocket)
 
 
@@ -6,7 +6,7 @@ from typing import List, Optional
 import uuid
 import pytz
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -73,6 +73,35 @@ def calculate_next_run(frequency: ScheduleFrequency, time_of_day: time, timezone
 
 router = APIRouter()
 
+# Schedules change rarely but the dashboard polls them, so reads carry an ETag
+# and clients are asked to revalidate rather than refetch.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a quoted ETag from row counts / updated_at timestamps."""
+    return '"' + "-".join(
+        part.isoformat() if isinstance(part, datetime) else str(part)
+        for part in parts
+    ) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response for a matching If-None-Match."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
 
 class ScheduleCreate(BaseModel):
     """Schedule creation schema."""
@@ -115,6 +144,8 @@ class ScheduleResponse(BaseModel):
 
 @router.get("", response_model=List[ScheduleResponse])
 async def list_schedules(
+    request: Request,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
     application_id: Optional[uuid.UUID] = None,
@@ -122,29 +153,54 @@ async def list_schedules(
 ):
     """
     List scan schedules.
+
+    Returns 304 Not Modified when If-None-Match matches the current ETag,
+    which is derived from the row count and latest updated_at of the
+    matching schedules and their applications.
     """
-    query = select(ScanSchedule)
+    filters = []
 
     if application_id:
-        query = query.where(ScanSchedule.application_id == application_id)
+        filters.append(ScanSchedule.application_id == application_id)
 
     if is_active is not None:
-        query = query.where(ScanSchedule.is_active == is_active)
+        filters.append(ScanSchedule.is_active == is_active)
 
-    result = await db.execute(query.order_by(ScanSchedule.created_at.desc()))
-    schedules = result.scalars().all()
+    join_on = Application.id == ScanSchedule.application_id
 
-    # Enrich with application names
-    items = []
-    for schedule in schedules:
-        app_result = await db.execute(
-            select(Application.name).where(Application.id == schedule.application_id)
+    # Cheap aggregate first: a matching ETag skips loading and serializing rows
+    stamp_result = await db.execute(
+        select(
+            func.count(ScanSchedule.id),
+            func.max(ScanSchedule.updated_at),
+            func.max(Application.updated_at),
         )
-        app_name = app_result.scalar_one_or_none()
+        .select_from(ScanSchedule)
+        .outerjoin(Application, join_on)
+        .where(*filters)
+    )
+    count, schedules_updated_at, applications_updated_at = stamp_result.one()
+    etag = make_etag(count, schedules_updated_at, applications_updated_at)
+
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+    # Enrich with application names in the same query
+    result = await db.execute(
+        select(ScanSchedule, Application.name)
+        .outerjoin(Application, join_on)
+        .where(*filters)
+        .order_by(ScanSchedule.created_at.desc())
+    )
 
-        response = ScheduleResponse.model_validate(schedule)
-        response.application_name = app_name
-        items.append(response)
+    items = []
+    for schedule, app_name in result.all():
+        item = ScheduleResponse.model_validate(schedule)
+        item.application_name = app_name
+        items.append(item)
 
     return items
 
@@ -152,11 +208,15 @@ async def list_schedules(
 @router.get("/{schedule_id}", response_model=ScheduleResponse)
 async def get_schedule(
     schedule_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: DbSession,
     current_user: CurrentUser,
 ):
     """
     Get schedule by ID.
+
+    Returns 304 Not Modified when If-None-Match matches the schedule's ETag.
     """
     result = await db.execute(
         select(ScanSchedule).where(ScanSchedule.id == schedule_id)
@@ -169,6 +229,13 @@ async def get_schedule(
             detail="Schedule not found",
         )
 
+    etag = make_etag(schedule.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
     return schedule
 
 
@@ -1,7 +1,7 @@
 """
 DPDP GUI Compliance Scanner - Database Configuration
 """
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
@@ -9,6 +9,27 @@ from sqlalchemy.orm import DeclarativeBase
 from app.core.config import settings
 
 
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Driver-specific engine options.
+
+    For PostgreSQL via asyncpg, prepared statements are cached per connection
+    (both SQLAlchemy's and asyncpg's own cache), so repeated queries are
+    parsed and planned once, and the isolation level is pinned explicitly.
+    """
+    if not database_url.startswith("postgresql+asyncpg"):
+        return {}
+
+    cache_size = settings.DATABASE_STATEMENT_CACHE_SIZE
+    return {
+        "isolation_level": settings.DATABASE_ISOLATION_LEVEL,
+        "connect_args": {
+            "prepared_statement_cache_size": cache_size,
+            "statement_cache_size": cache_size,
+        },
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -16,6 +37,7 @@ engine = create_async_engine(
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_pre_ping=True,
+    **get_engine_options(settings.DATABASE_URL),
 )
 
 # Create async session factory
@@ -6,59 +6,49 @@ Calculates compliance scores based on:
 2. Finding severity levels
 3. Normalization by pages/windows scanned
 """
-from typing import List, Dict, Any, Tuple
+import re
+import sys
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    np = None  # type: ignore[assignment]
+
 
 # DPDP Section Penalties (in Crores as per DPDP Act 2023)
+# Keyed by parent section only: subsections ("Section 9(1)") share the
+# parent's penalty and are resolved through _SECTION_RE.
 SECTION_PENALTIES = {
     # Section 5: Notice - Up to 50 Crore
     "Section 5": 50,
-    "Section 5(1)": 50,
-    "Section 5(2)": 50,
 
     # Section 6: Consent - Up to 50 Crore
     "Section 6": 50,
-    "Section 6(1)": 50,
-    "Section 6(3)": 50,
-    "Section 6(4)": 50,
-    "Section 6(5)": 50,
-    "Section 6(6)": 50,  # Consent withdrawal
-    "Section 6(7)": 50,
 
     # Section 7: Deemed Consent - Up to 50 Crore
     "Section 7": 50,
 
     # Section 8: Data Retention - Up to 50 Crore
     "Section 8": 50,
-    "Section 8(3)": 50,
-    "Section 8(7)": 50,
 
     # Section 9: Children's Data - Up to 200 Crore (HIGHEST PENALTY)
     "Section 9": 200,
-    "Section 9(1)": 200,
-    "Section 9(2)": 200,
-    "Section 9(3)": 200,
-    "Section 9(4)": 200,
 
     # Section 10: Significant Data Fiduciary - Up to 50 Crore
     "Section 10": 50,
 
     # Section 11: Data Principal Rights - Up to 50 Crore
     "Section 11": 50,
-    "Section 11(1)": 50,
-    "Section 11(2)": 50,
-    "Section 11(3)": 50,
 
     # Section 12: Right to Correction/Erasure - Up to 50 Crore
     "Section 12": 50,
-    "Section 12(1)": 50,
-    "Section 12(2)": 50,
 
     # Section 13: Grievance Redressal - Up to 50 Crore
     "Section 13": 50,
-    "Section 13(1)": 50,
-    "Section 13(2)": 50,
 
     # Section 15: Data Breach - Up to 200 Crore
     "Section 15": 200,
@@ -76,6 +66,29 @@ SECTION_PENALTIES = {
     "Other": 25,
 }
 
+# Human-readable names, keyed like SECTION_PENALTIES
+SECTION_NAMES = {
+    "Section 5": "Notice to Data Principal",
+    "Section 6": "Consent Requirements",
+    "Section 7": "Deemed Consent",
+    "Section 8": "Data Retention & Erasure",
+    "Section 9": "Children's Data Protection",
+    "Section 10": "Significant Data Fiduciary",
+    "Section 11": "Data Principal Rights",
+    "Section 12": "Right to Correction/Erasure",
+    "Section 13": "Grievance Redressal",
+    "Section 15": "Data Breach Notification",
+    "Section 16": "Government Data Processing",
+    "Section 17": "Cross-border Transfer",
+    "Section 18": "Dark Patterns Prevention",
+    "Other": "General Compliance",
+}
+
+# Intern section keys so lookups with interned finding sections (see
+# _finding_rows and app.models.base.InternedString) match by identity
+SECTION_PENALTIES = {sys.intern(section): penalty for section, penalty in SECTION_PENALTIES.items()}
+SECTION_NAMES = {sys.intern(section): name for section, name in SECTION_NAMES.items()}
+
 # Severity multipliers - how much of the section penalty applies
 SEVERITY_MULTIPLIERS = {
     "critical": 1.0,    # 100% of section penalty
@@ -89,8 +102,26 @@ SEVERITY_MULTIPLIERS = {
 # Used for normalization
 MAX_SECTION_PENALTY = 200  # Highest single section penalty (Section 9 or 15)
 
+# Extracts the parent section number, e.g. "Section 9(1)" -> "9"
+_SECTION_RE = re.compile(r'Section\s*(\d+)')
+
+# Findings count above which section tallies are computed with numpy
+VECTORIZE_MIN_FINDINGS = 200
 
-@dataclass
+# Severity -> (bucket index, multiplier) so each finding is classified with a
+# single dict lookup. Buckets 0-3 are the counted severities (critical, high,
+# medium, low) and 4 is "info"; unrecognized severities go to bucket 5 with the
+# default multiplier and findings without a severity to bucket 6.
+_SEVERITY_DISPATCH = {
+    severity: (index, SEVERITY_MULTIPLIERS[severity])
+    for index, severity in enumerate(("critical", "high", "medium", "low", "info"))
+}
+_UNKNOWN_SEVERITY = (5, 0.3)
+_MISSING_SEVERITY_INDEX = 6
+_SEVERITY_BUCKET_MULTIPLIERS = (1.0, 0.6, 0.3, 0.1, 0.0, 0.3, 0.0)
+
+
+@dataclass(slots=True)
 class SectionScore:
     """Score breakdown for a single DPDP section."""
     section: str
@@ -105,7 +136,7 @@ class SectionScore:
     status: str  # "pass", "warning", "fail"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceScoreResult:
     """Complete compliance score result."""
     overall_score: float
@@ -121,22 +152,10 @@ def get_section_penalty(dpdp_section: str) -> int:
     if not dpdp_section:
         return SECTION_PENALTIES["Other"]
 
-    # Try exact match first
-    if dpdp_section in SECTION_PENALTIES:
-        return SECTION_PENALTIES[dpdp_section]
-
-    # Try to match parent section (e.g., "Section 9(1)" -> "Section 9")
-    for key in SECTION_PENALTIES:
-        if dpdp_section.startswith(key):
-            return SECTION_PENALTIES[key]
-
-    # Check if section number is mentioned
-    import re
-    match = re.search(r'Section\s*(\d+)', dpdp_section)
+    # Resolve the parent section (e.g., "Section 9(1)" -> "Section 9")
+    match = _SECTION_RE.search(dpdp_section)
     if match:
-        section_num = f"Section {match.group(1)}"
-        if section_num in SECTION_PENALTIES:
-            return SECTION_PENALTIES[section_num]
+        return SECTION_PENALTIES.get(f"Section {match.group(1)}", SECTION_PENALTIES["Other"])
 
     return SECTION_PENALTIES["Other"]
 
@@ -168,59 +187,61 @@ def calculate_compliance_score(
     Returns:
         ComplianceScoreResult or float score (0-100)
     """
-    if not findings:
-        # Perfect score if no findings
-        if return_detailed:
-            return ComplianceScoreResult(
-                overall_score=100.0,
-                grade="A+",
-                risk_level="Minimal",
-                penalty_exposure="None",
-                section_scores=[],
-                summary={
-                    "total_findings": 0,
-                    "pages_scanned": pages_scanned,
-                    "findings_per_page": 0,
-                }
-            )
-        return 100.0
-
-    # Group findings by section
-    section_findings: Dict[str, List[Any]] = {}
+    result = _score_finding_rows(_finding_rows(findings), pages_scanned)
+
+    if return_detailed:
+        return result
+    return result.overall_score
+
+
+def _finding_rows(findings: List[Any]) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Reduce findings to the hashable (section, severity) rows scoring depends on."""
+    rows = []
     for finding in findings:
-        section = getattr(finding, 'dpdp_section', None) or "Other"
-        if section not in section_findings:
-            section_findings[section] = []
-        section_findings[section].append(finding)
+        section = sys.intern(getattr(finding, 'dpdp_section', None) or "Other")
+        severity = getattr(finding, 'severity', None)
+        if severity:
+            severity = severity.value if hasattr(severity, 'value') else str(severity)
+        else:
+            severity = None
+        rows.append((section, severity))
+    return tuple(rows)
+
+
+def _score_finding_rows(
+    rows: Tuple[Tuple[str, Optional[str]], ...],
+    pages_scanned: int,
+) -> ComplianceScoreResult:
+    """Compute the detailed score for (section, severity) rows."""
+    if not rows:
+        # Perfect score if no findings
+        return ComplianceScoreResult(
+            overall_score=100.0,
+            grade="A+",
+            risk_level="Minimal",
+            penalty_exposure="None",
+            section_scores=[],
+            summary={
+                "total_findings": 0,
+                "pages_scanned": pages_scanned,
+                "findings_per_page": 0,
+            }
+        )
+
+    # Tally findings per section: [findings, critical, high, medium, low, penalty points]
+    if NUMPY_AVAILABLE and len(rows) > VECTORIZE_MIN_FINDINGS:
+        section_tallies = _tally_sections_vectorized(rows)
+    else:
+        section_tallies = _tally_sections(rows)
 
     # Calculate penalty points per section
-    total_penalty_points = 0
+    total_penalty_points: float = 0.0
     section_scores = []
     max_penalty_exposure = 0
 
-    for section, section_findings_list in section_findings.items():
+    for section, tally in section_tallies.items():
         section_penalty = get_section_penalty(section)
-        section_points = 0
-
-        critical = high = medium = low = 0
-
-        for finding in section_findings_list:
-            severity = getattr(finding, 'severity', None)
-            if severity:
-                severity_str = severity.value if hasattr(severity, 'value') else str(severity)
-                multiplier = get_severity_multiplier(severity_str)
-                section_points += section_penalty * multiplier
-
-                # Count by severity
-                severity_lower = severity_str.lower()
-                if severity_lower == "critical":
-                    critical += 1
-                elif severity_lower == "high":
-                    high += 1
-                elif severity_lower == "medium":
-                    medium += 1
-                elif severity_lower == "low":
-                    low += 1
+        findings_count, critical, high, medium, low, section_points = tally
 
         total_penalty_points += section_points
 
@@ -230,11 +251,12 @@ def calculate_compliance_score(
 
         # Calculate section score (0-100)
         # A section is "passing" if penalty points < 50% of max possible
-        max_section_points = section_penalty * len(section_findings_list)
+        max_section_points = section_penalty * findings_count
+        section_score: float
         if max_section_points > 0:
-            section_score = max(0, 100 - (section_points / max_section_points * 100))
+            section_score = max(0.0, 100 - (section_points / max_section_points * 100))
         else:
-            section_score = 100
+            section_score = 100.0
 
         # Determine section status
         if section_score >= 80:
@@ -248,7 +270,7 @@ def calculate_compliance_score(
             section=section,
             section_name=get_section_name(section),
             penalty_crores=section_penalty,
-            findings_count=len(section_findings_list),
+            findings_count=findings_count,
             critical_count=critical,
             high_count=high,
             medium_count=medium,
@@ -263,7 +285,7 @@ def calculate_compliance_score(
     pages_factor = max(pages_scanned, 1)
 
     # Calculate findings density (findings per page)
-    findings_density = len(findings) / pages_factor
+    findings_density = len(rows) / pages_factor
 
     # Normalize penalty points
     # Base normalization: divide by pages, but cap the benefit
@@ -278,7 +300,7 @@ def calculate_compliance_score(
     scale_factor = 500  # Tuned for reasonable score distribution
 
     raw_score = 100 - (normalized_penalty / scale_factor * 100)
-    overall_score = max(0, min(100, raw_score))
+    overall_score = max(0.0, min(100.0, raw_score))
 
     # Round to 1 decimal
     overall_score = round(overall_score, 1)
@@ -298,14 +320,14 @@ def calculate_compliance_score(
     total_medium = sum(s.medium_count for s in section_scores)
     total_low = sum(s.low_count for s in section_scores)
 
-    result = ComplianceScoreResult(
+    return ComplianceScoreResult(
         overall_score=overall_score,
         grade=grade,
         risk_level=risk_level,
         penalty_exposure=penalty_exposure,
         section_scores=sorted(section_scores, key=lambda x: x.section_score),
         summary={
-            "total_findings": len(findings),
+            "total_findings": len(rows),
             "critical_count": total_critical,
             "high_count": total_high,
             "medium_count": total_medium,
@@ -319,9 +341,81 @@ def calculate_compliance_score(
         }
     )
 
-    if return_detailed:
-        return result
-    return overall_score
+
+def _severity_dispatch(severity_str: str) -> Tuple[int, float]:
+    """Look up (bucket index, multiplier) for a severity value."""
+    dispatch = _SEVERITY_DISPATCH.get(severity_str)
+    if dispatch is None:
+        dispatch = _SEVERITY_DISPATCH.get(severity_str.lower(), _UNKNOWN_SEVERITY)
+    return dispatch
+
+
+def _tally_sections(rows: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, List[Any]]:
+    """Group finding rows by section and count severities / penalty points."""
+    tallies: Dict[str, List[Any]] = {}
+    penalties: Dict[str, int] = {}
+    for section, severity_str in rows:
+        tally = tallies.get(section)
+        if tally is None:
+            tally = tallies[section] = [0, 0, 0, 0, 0, 0]
+            penalties[section] = get_section_penalty(section)
+        tally[0] += 1
+
+        if severity_str:
+            bucket, multiplier = _severity_dispatch(severity_str)
+            tally[5] += penalties[section] * multiplier
+
+            # Count by severity (critical/high/medium/low occupy tally[1:5])
+            if bucket < 4:
+                tally[bucket + 1] += 1
+
+    return tallies
+
+
+def _tally_sections_vectorized(rows: Tuple[Tuple[str, Optional[str]], ...]) -> Dict[str, List[Any]]:
+    """
+    numpy variant of _tally_sections for large finding sets.
+
+    Each row is mapped to a (section index, severity bucket) pair; counts
+    are accumulated with np.add.at and penalty points derived from the
+    per-bucket counts in one matrix product. Points can differ from the
+    loop's running sum by float rounding noise only.
+    """
+    section_index: Dict[str, int] = {}
+    section_idx = []
+    severity_idx = []
+    for section, severity_str in rows:
+        idx = section_index.get(section)
+        if idx is None:
+            idx = section_index[section] = len(section_index)
+        section_idx.append(idx)
+
+        if severity_str:
+            severity_idx.append(_severity_dispatch(severity_str)[0])
+        else:
+            severity_idx.append(_MISSING_SEVERITY_INDEX)
+
+    counts = np.zeros((len(section_index), len(_SEVERITY_BUCKET_MULTIPLIERS)), dtype=np.int64)
+    np.add.at(
+        counts,
+        (np.asarray(section_idx, dtype=np.intp), np.asarray(severity_idx, dtype=np.intp)),
+        1,
+    )
+    penalties = np.array([get_section_penalty(section) for section in section_index], dtype=np.float64)
+    points = (counts @ np.asarray(_SEVERITY_BUCKET_MULTIPLIERS)) * penalties
+    totals = counts.sum(axis=1)
+
+    return {
+        section: [
+            int(totals[idx]),
+            int(counts[idx, 0]),
+            int(counts[idx, 1]),
+            int(counts[idx, 2]),
+            int(counts[idx, 3]),
+            float(points[idx]),
+        ]
+        for section, idx in section_index.items()
+    }
 
 
 def get_grade(score: float) -> str:
@@ -409,34 +503,14 @@ def get_penalty_exposure(max_penalty: int, section_scores: List[SectionScore]) -
 
 def get_section_name(section: str) -> str:
     """Get human-readable section name."""
-    section_names = {
-        "Section 5": "Notice to Data Principal",
-        "Section 6": "Consent Requirements",
-        "Section 7": "Deemed Consent",
-        "Section 8": "Data Retention & Erasure",
-        "Section 9": "Children's Data Protection",
-        "Section 10": "Significant Data Fiduciary",
-        "Section 11": "Data Principal Rights",
-        "Section 12": "Right to Correction/Erasure",
-        "Section 13": "Grievance Redressal",
-        "Section 15": "Data Breach Notification",
-        "Section 16": "Government Data Processing",
-        "Section 17": "Cross-border Transfer",
-        "Section 18": "Dark Patterns Prevention",
-        "Other": "General Compliance",
-    }
-
     # Try exact match
-    if section in section_names:
-        return section_names[section]
+    if section in SECTION_NAMES:
+        return SECTION_NAMES[section]
 
     # Try parent section
-    import re
-    match = re.search(r'Section\s*(\d+)', section)
+    match = _SECTION_RE.search(section)
     if match:
-        parent = f"Section {match.group(1)}"
-        if parent in section_names:
-            return section_names[parent]
+        return SECTION_NAMES.get(f"Section {match.group(1)}", section)
 
     return section
 
@@ -457,4 +531,4 @@ def calculate_simple_score(
     score -= high_count * 10
     score -= medium_count * 5
     score -= low_count * 2
-    return max(0, float(score))
+    return max(0.0, float(score))
@@ -1,6 +1,9 @@
 """
 DPDP GUI Compliance Scanner - Security Utilities
 """
+import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -10,19 +13,76 @@ import bcrypt
 from app.core.config import settings
 
 
+class _TTLCache:
+    """Small size-bounded cache whose entries carry their own expiry time."""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Any, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any, now: float) -> Any:
+        """Return the cached value, or _TTLCache._MISSING if absent or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return self._MISSING
+        if entry[0] <= now:
+            self._data.pop(key, None)
+            return self._MISSING
+        return entry[1]
+
+    def set(self, key: Any, value: Any, expires_at: float):
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Short-lived cache of recent bcrypt verifications keyed by sha256(hash + password).
+# Security tradeoff: a successful verify stays valid for up to
+# PASSWORD_VERIFY_CACHE_TTL_SECONDS without paying the bcrypt cost again. Only a
+# digest is stored (never the plaintext), and the stored hash is part of the key,
+# so a password change invalidates old entries immediately.
+_verify_cache = _TTLCache(maxsize=settings.PASSWORD_VERIFY_CACHE_SIZE)
+
+# Decoded JWT payloads keyed by the raw token string. Entries never outlive the
+# token's own "exp" claim; invalid tokens are cached as None.
+_token_cache = _TTLCache(maxsize=settings.TOKEN_DECODE_CACHE_SIZE)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
     # Truncate to 72 bytes for bcrypt compatibility
     password_bytes = plain_password.encode('utf-8')[:72]
     hash_bytes = hashed_password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hash_bytes)
+
+    ttl = settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return bcrypt.checkpw(password_bytes, hash_bytes)
+
+    cache_key = hashlib.sha256(hash_bytes + b"\0" + password_bytes).digest()
+    now = time.monotonic()
+    cached = _verify_cache.get(cache_key, now)
+    if cached is not _TTLCache._MISSING:
+        return cached
+
+    result = bcrypt.checkpw(password_bytes, hash_bytes)
+    _verify_cache.set(cache_key, result, now + ttl)
+    return result
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash."""
     # Truncate to 72 bytes for bcrypt compatibility
     password_bytes = password.encode('utf-8')[:72]
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
 
 
@@ -89,6 +149,29 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
     Returns:
         Token payload if valid, None otherwise
     """
+    ttl = settings.TOKEN_DECODE_CACHE_TTL_SECONDS
+    if ttl <= 0:
+        return _decode_token_uncached(token)
+
+    now = time.time()
+    cached = _token_cache.get(token, now)
+    if cached is not _TTLCache._MISSING:
+        return cached
+
+    payload = _decode_token_uncached(token)
+    if payload is None:
+        # Remember failures briefly so bad tokens are not re-verified per request
+        _token_cache.set(token, None, now + min(ttl, 5))
+    else:
+        expires_at = now + ttl
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        _token_cache.set(token, payload, expires_at)
+    return payload
+
+
+def _decode_token_uncached(token: str) -> Optional[dict[str, Any]]:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
@@ -4,14 +4,27 @@ DPDP GUI Compliance Scanner - WebSocket Manager
 Manages real-time WebSocket connections for scan progress updates.
 """
 import asyncio
-import json
-from dataclasses import asdict, dataclass
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
+# Redis pub/sub channel for a scan's events is f"{SCAN_CHANNEL_PREFIX}{scan_id}"
+SCAN_CHANNEL_PREFIX = "scan:"
+
+# Maximum websocket sends gathered at once by a broadcast
+BROADCAST_BATCH_SIZE = 50
+
+# Published progress messages start with this (ScanProgressReporter puts
+# "type" first and orjson output is compact), so they can be recognized
+# without decoding
+PROGRESS_MESSAGE_PREFIX = b'{"type":"progress",'
+
 
-@dataclass
+@dataclass(slots=True)
 class ScanProgress:
     """Scan progress update message."""
     scan_id: str
@@ -37,10 +50,53 @@ class ScanProgress:
             self.timestamp = datetime.utcnow().isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand rather than with dataclasses.asdict (which recurses
+        # and deep-copies): this runs on every progress tick
+        return {
+            "scan_id": self.scan_id,
+            "status": self.status,
+            "current_step": self.current_step,
+            "total_steps": self.total_steps,
+            "percent": self.percent,
+            "message": self.message,
+            "current_url": self.current_url,
+            "findings_count": self.findings_count,
+            "pages_scanned": self.pages_scanned,
+            "total_pages": self.total_pages,
+            "critical_count": self.critical_count,
+            "high_count": self.high_count,
+            "medium_count": self.medium_count,
+            "low_count": self.low_count,
+            "elapsed_seconds": self.elapsed_seconds,
+            "estimated_remaining_seconds": self.estimated_remaining_seconds,
+            "timestamp": self.timestamp,
+        }
+
+    def to_message(self, message_type: str) -> Dict[str, Any]:
+        """Build a WebSocket message: {"type": message_type, **to_dict()} in one dict."""
+        return {
+            "type": message_type,
+            "scan_id": self.scan_id,
+            "status": self.status,
+            "current_step": self.current_step,
+            "total_steps": self.total_steps,
+            "percent": self.percent,
+            "message": self.message,
+            "current_url": self.current_url,
+            "findings_count": self.findings_count,
+            "pages_scanned": self.pages_scanned,
+            "total_pages": self.total_pages,
+            "critical_count": self.critical_count,
+            "high_count": self.high_count,
+            "medium_count": self.medium_count,
+            "low_count": self.low_count,
+            "elapsed_seconds": self.elapsed_seconds,
+            "estimated_remaining_seconds": self.estimated_remaining_seconds,
+            "timestamp": self.timestamp,
+        }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict())
+        return orjson.dumps(self.to_dict()).decode()
 
 
 class ConnectionManager:
@@ -59,8 +115,9 @@ class ConnectionManager:
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         # Map of websocket -> scan_id for cleanup
         self.connection_scans: Dict[WebSocket, str] = {}
-        # Lock for thread-safe operations
-        self._lock = asyncio.Lock()
+        # No lock: everything runs on one event loop and the registry is only
+        # mutated in code with no await in between, so it is never observed
+        # half-updated.
 
     async def connect(self, websocket: WebSocket, scan_id: str):
         """
@@ -72,12 +129,8 @@ class ConnectionManager:
         """
         await websocket.accept()
 
-        async with self._lock:
-            if scan_id not in self.active_connections:
-                self.active_connections[scan_id] = set()
-
-            self.active_connections[scan_id].add(websocket)
-            self.connection_scans[websocket] = scan_id
+        self.active_connections.setdefault(scan_id, set()).add(websocket)
+        self.connection_scans[websocket] = scan_id
 
         # Send initial connection confirmation
         await self.send_personal_message(
@@ -96,17 +149,18 @@ class ConnectionManager:
         Args:
             websocket: WebSocket connection to remove
         """
-        async with self._lock:
-            scan_id = self.connection_scans.get(websocket)
-            if scan_id and scan_id in self.active_connections:
-                self.active_connections[scan_id].discard(websocket)
+        self._remove_connection(websocket)
 
-                # Clean up empty scan entries
-                if not self.active_connections[scan_id]:
-                    del self.active_connections[scan_id]
+    def _remove_connection(self, websocket: WebSocket):
+        """Unregister a websocket; synchronous so send error paths never await."""
+        scan_id = self.connection_scans.pop(websocket, None)
+        connections = self.active_connections.get(scan_id)
+        if connections is not None:
+            connections.discard(websocket)
 
-            if websocket in self.connection_scans:
-                del self.connection_scans[websocket]
+            # Clean up empty scan entries
+            if not connections:
+                del self.active_connections[scan_id]
 
     async def send_personal_message(
         self,
@@ -121,9 +175,9 @@ class ConnectionManager:
             message: Message to send
         """
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception:
-            await self.disconnect(websocket)
+            self._remove_connection(websocket)
 
     async def broadcast_to_scan(self, scan_id: str, message: Dict[str, Any]):
         """
@@ -133,19 +187,71 @@ class ConnectionManager:
             scan_id: Scan ID to broadcast to
             message: Message to broadcast
         """
-        async with self._lock:
-            connections = self.active_connections.get(scan_id, set()).copy()
+        if scan_id not in self.active_connections:
+            return
+
+        # Serialize once for all subscribers
+        await self.broadcast_raw_to_scan(scan_id, orjson.dumps(message).decode())
+
+    async def broadcast_raw_to_scan(self, scan_id: str, payload: str):
+        """
+        Broadcast an already-serialized JSON message to a scan's subscribers.
 
-        disconnected = []
-        for connection in connections:
+        Sent as a text frame since clients JSON.parse the frame data directly.
+
+        Args:
+            scan_id: Scan ID to broadcast to
+            payload: JSON-encoded message
+        """
+        # Snapshot the subscribers; sends below may await and let the set change
+        connections = tuple(self.active_connections.get(scan_id, ()))
+
+        if not connections:
+            return
+
+        if len(connections) == 1:
+            # Common case of a single open tab: await the send directly
+            # instead of paying for gather's task wrapping
+            connection = connections[0]
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception:
-                disconnected.append(connection)
+                self._remove_connections(scan_id, {connection})
+            return
+
+        # Send to all subscribers concurrently so one slow client does not
+        # hold up the rest, in batches so a large fan-out yields to the loop
+        disconnected = set()
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            if start:
+                await asyncio.sleep(0)
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            # Coroutines built in one list comprehension (one send_text
+            # lookup each, no generator frame)
+            sends = [connection.send_text(payload) for connection in batch]
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            disconnected.update(
+                connection
+                for connection, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
+
+        # Clean up disconnected clients in one pass
+        if disconnected:
+            self._remove_connections(scan_id, disconnected)
+
+    def _remove_connections(self, scan_id: str, websockets: Set[WebSocket]):
+        """Unregister a batch of a scan's websockets at once."""
+        connections = self.active_connections.get(scan_id)
+        if connections is not None:
+            connections -= websockets
+
+            # Clean up empty scan entries
+            if not connections:
+                del self.active_connections[scan_id]
 
-        # Clean up disconnected clients
-        for connection in disconnected:
-            await self.disconnect(connection)
+        for websocket in websockets:
+            self.connection_scans.pop(websocket, None)
 
     async def send_progress(self, progress: ScanProgress):
         """
@@ -154,11 +260,7 @@ class ConnectionManager:
         Args:
             progress: ScanProgress object with update details
         """
-        message = {
-            "type": "progress",
-            **progress.to_dict(),
-        }
-        await self.broadcast_to_scan(progress.scan_id, message)
+        await self.broadcast_to_scan(progress.scan_id, progress.to_message("progress"))
 
     async def send_finding(
         self,
@@ -229,7 +331,8 @@ class ConnectionManager:
 
     def get_total_connections(self) -> int:
         """Get total number of active connections."""
-        return sum(len(conns) for conns in self.active_connections.values())
+        # Every registered websocket has exactly one connection_scans entry
+        return len(self.connection_scans)
 
 
 # Global connection manager instance
@@ -247,6 +350,11 @@ class ScanProgressReporter:
         self.scan_id = scan_id
         self.redis_url = redis_url
         self._redis = None
+        self._channel = f"{SCAN_CHANNEL_PREFIX}{scan_id}"
+        # Outgoing messages are queued and published in pipelined batches by
+        # a background flusher, so callers never wait on a Redis round trip
+        self._outbox: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
         self._total_steps = 100
         self._current_step = 0
         self._findings_count = 0
@@ -256,7 +364,8 @@ class ScanProgressReporter:
         self._high_count = 0
         self._medium_count = 0
         self._low_count = 0
-        self._started_at: Optional[datetime] = None
+        # time.monotonic() reading; immune to wall-clock adjustments
+        self._started_at: Optional[float] = None
 
     async def connect(self):
         """Connect to Redis for pub/sub."""
@@ -268,12 +377,50 @@ class ScanProgressReporter:
         except Exception as e:
             print(f"Could not connect to Redis for progress updates: {e}")
             self._redis = None
+            return
+
+        self._outbox = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_loop())
 
     async def disconnect(self):
-        """Disconnect from Redis."""
+        """Flush pending messages and disconnect from Redis."""
+        if self._flusher:
+            # Deliver everything queued so far (e.g. the completion message)
+            await self._outbox.join()
+            self._flusher.cancel()
+            self._flusher = None
         if self._redis:
             await self._redis.close()
 
+    async def _flush_loop(self):
+        """
+        Publish queued messages, batching whatever accumulated while the
+        previous batch was in flight into one pipeline round trip.
+        """
+        while True:
+            batch = [await self._outbox.get()]
+            while True:
+                try:
+                    batch.append(self._outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    for message in batch:
+                        pipe.publish(self._channel, message)
+                    await pipe.execute()
+            except Exception as e:
+                print(f"Could not publish progress updates for scan {self.scan_id}: {e}")
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+
+    def _enqueue(self, message: Dict[str, Any]):
+        """Queue a message for publishing on the scan's channel."""
+        if self._outbox is not None:
+            self._outbox.put_nowait(orjson.dumps(message))
+
     def set_total_steps(self, total: int):
         """Set the total number of steps."""
         self._total_steps = total
@@ -284,7 +431,7 @@ class ScanProgressReporter:
 
     def start_timer(self):
         """Start the scan timer."""
-        self._started_at = datetime.utcnow()
+        self._started_at = time.monotonic()
 
     def increment_severity(self, severity: str):
         """Increment severity count."""
@@ -299,10 +446,10 @@ class ScanProgressReporter:
 
     def _calculate_timing(self) -> tuple:
         """Calculate elapsed and estimated remaining time."""
-        if not self._started_at:
+        if self._started_at is None:
             return 0, None
 
-        elapsed = (datetime.utcnow() - self._started_at).total_seconds()
+        elapsed = time.monotonic() - self._started_at
         elapsed_seconds = int(elapsed)
 
         # Estimate remaining time based on pages scanned
@@ -343,91 +490,175 @@ class ScanProgressReporter:
         percent = int((self._current_step / self._total_steps) * 100)
         elapsed_seconds, estimated_remaining = self._calculate_timing()
 
-        progress = ScanProgress(
-            scan_id=self.scan_id,
-            status="running",
-            current_step=self._current_step,
-            total_steps=self._total_steps,
-            percent=min(percent, 100),
-            message=message,
-            current_url=current_url,
-            findings_count=self._findings_count,
-            pages_scanned=self._pages_scanned,
-            total_pages=self._total_pages,
-            critical_count=self._critical_count,
-            high_count=self._high_count,
-            medium_count=self._medium_count,
-            low_count=self._low_count,
-            elapsed_seconds=elapsed_seconds,
-            estimated_remaining_seconds=estimated_remaining,
-        )
-
-        await self._publish(progress)
+        # Same shape as {"type": "progress", **ScanProgress.to_dict()}, built
+        # directly since the worker only needs the serialized message
+        self._enqueue({
+            "type": "progress",
+            "scan_id": self.scan_id,
+            "status": "running",
+            "current_step": self._current_step,
+            "total_steps": self._total_steps,
+            "percent": min(percent, 100),
+            "message": message,
+            "current_url": current_url,
+            "findings_count": self._findings_count,
+            "pages_scanned": self._pages_scanned,
+            "total_pages": self._total_pages,
+            "critical_count": self._critical_count,
+            "high_count": self._high_count,
+            "medium_count": self._medium_count,
+            "low_count": self._low_count,
+            "elapsed_seconds": elapsed_seconds,
+            "estimated_remaining_seconds": estimated_remaining,
+            "timestamp": datetime.utcnow().isoformat(),
+        })
 
     async def report_finding(self, finding: Dict[str, Any]):
         """Report a new finding."""
-        if self._redis:
-            message = json.dumps({
-                "type": "finding",
-                "scan_id": self.scan_id,
-                "finding": finding,
-            })
-            await self._redis.publish(f"scan:{self.scan_id}", message)
+        self._enqueue({
+            "type": "finding",
+            "scan_id": self.scan_id,
+            "finding": finding,
+        })
 
     async def complete(self, status: str, summary: Dict[str, Any]):
         """Report scan completion."""
-        if self._redis:
-            message = json.dumps({
-                "type": "completed",
-                "scan_id": self.scan_id,
-                "status": status,
-                "summary": summary,
-            })
-            await self._redis.publish(f"scan:{self.scan_id}", message)
+        self._enqueue({
+            "type": "completed",
+            "scan_id": self.scan_id,
+            "status": status,
+            "summary": summary,
+        })
 
     async def error(self, error_message: str):
         """Report an error."""
-        if self._redis:
-            message = json.dumps({
-                "type": "error",
-                "scan_id": self.scan_id,
-                "error": error_message,
-            })
-            await self._redis.publish(f"scan:{self.scan_id}", message)
-
-    async def _publish(self, progress: ScanProgress):
-        """Publish progress to Redis channel."""
-        if self._redis:
-            message = json.dumps({
-                "type": "progress",
-                **progress.to_dict(),
-            })
-            await self._redis.publish(f"scan:{self.scan_id}", message)
+        self._enqueue({
+            "type": "error",
+            "scan_id": self.scan_id,
+            "error": error_message,
+        })
 
 
-async def websocket_subscriber(scan_id: str, redis_url: str):
+class ScanEventSubscriber:
     """
-    Subscribe to Redis channel and forward messages to WebSocket clients.
+    Forwards scan events from Redis to local WebSocket subscribers.
+
+    One pattern subscription ("scan:*") on a single Redis connection serves
+    every scan; messages are routed by channel name. Started once from the
+    application lifespan.
 
-    This should be run as a background task for each active scan.
+    Progress updates are conflated per scan: after one is forwarded, further
+    progress messages of that scan within PROGRESS_INTERVAL only keep the
+    latest, which is flushed at the end of the scan's interval. Findings, completion and errors are
+    forwarded immediately, preceded by any progress still held for that scan
+    so clients see events in order.
     """
-    try:
+
+    # Seconds to wait before reconnecting after a Redis error
+    RECONNECT_DELAY = 5
+
+    # Minimum seconds between forwarded progress updates
+    PROGRESS_INTERVAL = 0.05
+
+    def __init__(self, connection_manager: ConnectionManager):
+        self.manager = connection_manager
+        self._task: Optional[asyncio.Task] = None
+        # scan_id -> latest held progress message
+        self._pending_progress: Dict[str, bytes] = {}
+        # scan_id -> loop time until which that scan's progress is held
+        self._progress_hold_until: Dict[str, float] = {}
+
+    async def start(self, redis_url: str):
+        """Start the background subscriber task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(redis_url))
+
+    async def stop(self):
+        """Stop the background subscriber task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, redis_url: str):
+        """Listen for scan events, reconnecting after Redis errors."""
         import redis.asyncio as aioredis
 
-        redis = await aioredis.from_url(redis_url)
-        pubsub = redis.pubsub()
-        await pubsub.subscribe(f"scan:{scan_id}")
+        loop = asyncio.get_running_loop()
 
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                try:
-                    data = json.loads(message["data"])
-                    await manager.broadcast_to_scan(scan_id, data)
-                except json.JSONDecodeError:
-                    pass
-
-    except Exception as e:
-        print(f"WebSocket subscriber error for scan {scan_id}: {e}")
-    finally:
-        await pubsub.unsubscribe(f"scan:{scan_id}")
-        await redis.close()
+        while True:
+            redis = None
+            try:
+                redis = await aioredis.from_url(redis_url)
+                pubsub = redis.pubsub()
+                await pubsub.psubscribe(f"{SCAN_CHANNEL_PREFIX}*")
+
+                # Poll with a timeout (rather than pubsub.listen()) so held
+                # progress is flushed on time even when no messages arrive
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=self.PROGRESS_INTERVAL,
+                    )
+                    if message is not None and message["type"] == "pmessage":
+                        await self._dispatch(message["channel"], message["data"])
+
+                    if self._progress_hold_until:
+                        await self._flush_progress(loop.time())
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"WebSocket subscriber error: {e}")
+            finally:
+                if redis is not None:
+                    await redis.close()
+
+            await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _dispatch(self, channel: bytes, data: bytes):
+        """Route one published message to the scan's WebSocket clients."""
+        scan_id = channel[len(SCAN_CHANNEL_PREFIX):].decode()
+
+        # Events for scans nobody is watching on this server are dropped
+        if scan_id not in self.manager.active_connections:
+            return
+
+        if data.startswith(PROGRESS_MESSAGE_PREFIX):
+            now = asyncio.get_running_loop().time()
+            if now < self._progress_hold_until.get(scan_id, 0.0):
+                # Superseded by any later progress before the scan's flush
+                self._pending_progress[scan_id] = data
+                return
+            self._progress_hold_until[scan_id] = now + self.PROGRESS_INTERVAL
+        else:
+            # Keep ordering: deliver held progress before e.g. "completed"
+            pending = self._pending_progress.pop(scan_id, None)
+            if pending is not None:
+                await self.manager.broadcast_raw_to_scan(scan_id, pending.decode())
+
+        # The published bytes are already the JSON clients expect, so they
+        # are forwarded without a decode/re-encode round trip
+        await self.manager.broadcast_raw_to_scan(scan_id, data.decode())
+
+    async def _flush_progress(self, now: float):
+        """Forward held progress of each scan whose interval has ended."""
+        for scan_id, hold_until in list(self._progress_hold_until.items()):
+            if now < hold_until:
+                continue
+            data = self._pending_progress.pop(scan_id, None)
+            if data is None:
+                # Interval over with nothing held; the scan's next progress
+                # is forwarded immediately
+                del self._progress_hold_until[scan_id]
+                continue
+            # Forwarding starts a new interval for this scan
+            self._progress_hold_until[scan_id] = now + self.PROGRESS_INTERVAL
+            await self.manager.broadcast_raw_to_scan(scan_id, data.decode())
+
+
+# Global scan event subscriber, started from the application lifespan
+scan_event_subscriber = ScanEventSubscriber(manager)
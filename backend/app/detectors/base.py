@@ -3,8 +3,11 @@ DPDP GUI Compliance Scanner - Base Detector
 
 Abstract base class for all compliance detectors.
 """
+import re
 from abc import ABC, abstractmethod
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Set, TYPE_CHECKING
+
+from bs4 import BeautifulSoup
 
 from app.models.finding import Finding
 from app.scanners.web.crawler import CrawledPage
@@ -12,6 +15,100 @@ from app.scanners.web.crawler import CrawledPage
 if TYPE_CHECKING:
     from bs4 import Tag
 
+# Prefer the C-backed lxml tree builder; html.parser is pure Python
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Optional C extension for matching many keywords in one pass over the text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+# Cheap pre-parse test for pages that may contain a form
+FORM_TAG_RE = re.compile(r"<form", re.IGNORECASE)
+
+# Test-hook attributes that identify an element on their own, in priority order
+_TEST_ID_ATTRS = ("data-testid", "data-id", "data-cy")
+
+# Framework-generated class prefixes that make poor selectors
+_GENERATED_CLASS_PREFIXES = ("js-", "ng-", "_")
+
+
+def parse_html(html: str) -> BeautifulSoup:
+    """Parse page HTML with the fastest available BeautifulSoup tree builder."""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+def build_keyword_automaton(keywords: Sequence[str]) -> Optional[Any]:
+    """Build an Aho-Corasick automaton over keywords, or None without pyahocorasick."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_keywords(automaton: Optional[Any], keywords: Sequence[str], text: str) -> Set[str]:
+    """Return the keywords occurring as substrings of text, in a single pass when possible."""
+    if automaton is None:
+        return {keyword for keyword in keywords if keyword in text}
+    return {keyword for _, keyword in automaton.iter(text)}
+
+
+def build_group_automaton(groups: Dict[str, Sequence[str]]) -> Optional[Any]:
+    """Build one Aho-Corasick automaton over several named keyword groups."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    keyword_groups: Dict[str, List[str]] = {}
+    for group, keywords in groups.items():
+        for keyword in keywords:
+            keyword_groups.setdefault(keyword, []).append(group)
+    automaton = ahocorasick.Automaton()
+    for keyword, names in keyword_groups.items():
+        automaton.add_word(keyword, (keyword, tuple(names)))
+    automaton.make_automaton()
+    return automaton
+
+
+def find_group_keywords(
+    automaton: Optional[Any],
+    groups: Dict[str, Sequence[str]],
+    text: str,
+) -> Dict[str, Set[str]]:
+    """Return, per group, the keywords occurring in text, using a single pass when possible."""
+    if automaton is None:
+        return {
+            group: {keyword for keyword in keywords if keyword in text}
+            for group, keywords in groups.items()
+        }
+    hits: Dict[str, Set[str]] = {group: set() for group in groups}
+    for _, (keyword, names) in automaton.iter(text):
+        for group in names:
+            hits[group].add(keyword)
+    return hits
+
+
+def has_keywords(automaton: Optional[Any], keywords: Sequence[str], text: str, threshold: int) -> bool:
+    """Check whether at least threshold distinct keywords occur in text, stopping early."""
+    found: Set[str] = set()
+    if automaton is None:
+        matches = (keyword for keyword in keywords if keyword in text)
+    else:
+        matches = (keyword for _, keyword in automaton.iter(text))
+    for keyword in matches:
+        found.add(keyword)
+        if len(found) >= threshold:
+            return True
+    return False
+
 
 def generate_css_selector(element: "Tag") -> Optional[str]:
     """
@@ -33,59 +130,63 @@ def generate_css_selector(element: "Tag") -> Optional[str]:
         if not tag_name:
             return None
 
+        # Read attributes from the tag's attrs dict directly; this runs for
+        # every flagged element, and Tag.get adds a call per lookup
+        get_attr = element.attrs.get
+
         # Priority 1: Use ID if available (most reliable)
-        elem_id = element.get("id")
+        elem_id = get_attr("id")
         if elem_id and isinstance(elem_id, str) and elem_id.strip():
             # Escape special characters in ID
             safe_id = elem_id.strip().replace(":", "\\:")
             return f"#{safe_id}"
 
         # Priority 2: Use name attribute for form elements
-        elem_name = element.get("name")
+        elem_name = get_attr("name")
         if elem_name and isinstance(elem_name, str) and elem_name.strip():
             return f'{tag_name}[name="{elem_name.strip()}"]'
 
-        # Priority 3: Build selector with tag + attributes
+        # Priority 3: Use data-testid or data-id if available
+        for attr in _TEST_ID_ATTRS:
+            attr_val = get_attr(attr)
+            if attr_val and isinstance(attr_val, str):
+                return f'{tag_name}[{attr}="{attr_val}"]'
+
+        # For buttons/links, use the text content
+        if tag_name == "button" or tag_name == "a":
+            text = element.get_text(strip=True)[:20]
+            if text:
+                # Use :has-text or text content approach
+                # For Playwright, we can use text selector
+                return f'{tag_name}:has-text("{text}")'
+
+        # Priority 4: Build selector with tag + attributes
         selector_parts = [tag_name]
 
         # Add type attribute for inputs
-        elem_type = element.get("type")
+        elem_type = get_attr("type")
         if elem_type and isinstance(elem_type, str):
             selector_parts.append(f'[type="{elem_type}"]')
 
         # Add class if unique-looking (first class only)
-        elem_class = element.get("class")
+        elem_class = get_attr("class")
         if elem_class:
-            if isinstance(elem_class, list) and len(elem_class) > 0:
+            if isinstance(elem_class, list):
                 first_class = elem_class[0]
             else:
-                first_class = str(elem_class).split()[0] if elem_class else None
+                first_class = str(elem_class).split()[0]
 
-            if first_class and not first_class.startswith(("js-", "ng-", "_")):
+            if first_class and not first_class.startswith(_GENERATED_CLASS_PREFIXES):
                 selector_parts.append(f".{first_class}")
 
-        # Add data-testid or data-id if available
-        for attr in ["data-testid", "data-id", "data-cy"]:
-            attr_val = element.get(attr)
-            if attr_val and isinstance(attr_val, str):
-                return f'{tag_name}[{attr}="{attr_val}"]'
-
         # For specific elements, add more context
         if tag_name == "input":
-            placeholder = element.get("placeholder")
+            placeholder = get_attr("placeholder")
             if placeholder and isinstance(placeholder, str):
                 # Use contains for placeholder (partial match)
                 safe_placeholder = placeholder[:30].replace('"', '\\"')
                 selector_parts.append(f'[placeholder*="{safe_placeholder}"]')
 
-        if tag_name == "button" or tag_name == "a":
-            # Try to use text content for buttons/links
-            text = element.get_text(strip=True)[:20] if element.get_text(strip=True) else None
-            if text:
-                # Use :has-text or text content approach
-                # For Playwright, we can use text selector
-                return f'{tag_name}:has-text("{text}")'
-
         return "".join(selector_parts) if len(selector_parts) > 1 else None
 
     except Exception as e:
@@ -4,27 +4,495 @@ DPDP GUI Compliance Scanner - Children's Data Detector
 Detects compliance issues related to children's personal data per DPDP Section 9.
 Based on Real-Time-Examples-Scenarios.md format for detailed findings.
 """
+import asyncio
+import atexit
 import re
-from typing import List, Dict, Any
-from bs4 import BeautifulSoup
-
-from app.detectors.base import BaseDetector, generate_css_selector
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+from app.core.config import settings
+from app.detectors.base import (
+    HTML_PARSER,
+    FORM_TAG_RE,
+    BaseDetector,
+    build_group_automaton,
+    build_keyword_automaton,
+    find_group_keywords,
+    find_keywords,
+    generate_css_selector,
+    has_keywords,
+    parse_html,
+)
 from app.models.finding import CheckType, Finding, FindingSeverity, FindingStatus
 from app.scanners.web.crawler import CrawledPage
 
 
 def generate_visual_box(title: str, content_lines: List[str], width: int = 60) -> str:
     """Generate ASCII box diagram for visual representation."""
-    lines = []
     border = "─" * (width - 2)
-    lines.append(f"┌{border}┐")
-    lines.append(f"│  {title:<{width-6}}  │")
-    lines.append(f"├{border}┤")
-    for line in content_lines:
-        display_line = line[:width-6] if len(line) > width-6 else line
-        lines.append(f"│  {display_line:<{width-6}}  │")
-    lines.append(f"└{border}┘")
-    return "\n".join(lines)
+    inner = width - 6
+    return "\n".join([
+        f"┌{border}┐",
+        f"│  {title.ljust(inner)}  │",
+        f"├{border}┤",
+        *[f"│  {line[:inner].ljust(inner)}  │" for line in content_lines],
+        f"└{border}┘",
+    ])
+
+
+def match_host(host: str, hosts: Dict[str, str]) -> Optional[str]:
+    """Look up host and each of its parent domains in hosts, most specific first."""
+    labels = host.split(".")
+    for i in range(len(labels) - 1):
+        value = hosts.get(".".join(labels[i:]))
+        if value is not None:
+            return value
+    return None
+
+
+def compile_alternation(patterns: Sequence[str]) -> Any:
+    """
+    Compile patterns into one non-capturing alternation (never matches if empty).
+
+    Uses google-re2 when installed: its automaton matches in linear time, so
+    the ".*" patterns cannot backtrack on long page text. Falls back to re.
+    """
+    union = "|".join(f"(?:{p})" for p in patterns) if patterns else r"[^\s\S]"
+    if RE2_AVAILABLE:
+        return re2.compile(union)
+    return re.compile(union)
+
+
+class PatternProfiler:
+    """
+    Per-pattern search counts, matches and time over the pages scanned.
+
+    Development aid for spotting patterns that cost the most and match the
+    least on a real crawl; enabled with CHILDREN_PROFILE and printed when the
+    process exits. Each pattern is searched separately, so it slows scanning.
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]]):
+        self.patterns = [
+            (group, source, re.compile(source))
+            for group, sources in groups.items()
+            for source in sources
+        ]
+        # (group, pattern) -> [searches, matches, seconds]
+        self.stats: Dict[tuple, List[float]] = {
+            (group, source): [0, 0, 0.0] for group, source, _ in self.patterns
+        }
+        self._lock = threading.Lock()
+        atexit.register(self.report)
+
+    def record(self, text: str) -> None:
+        """Search text with every pattern individually and accumulate stats."""
+        for group, source, pattern in self.patterns:
+            start = time.perf_counter()
+            matched = pattern.search(text) is not None
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stat = self.stats[(group, source)]
+                stat[0] += 1
+                stat[1] += matched
+                stat[2] += elapsed
+
+    def report(self) -> None:
+        """Print stats, most expensive pattern first."""
+        print("[ChildrenDataDetector] Pattern profile (searches, matches, ms):")
+        for (group, source), (searches, matches, seconds) in sorted(
+            self.stats.items(), key=lambda item: item[1][2], reverse=True
+        ):
+            print(f"  {group:<8} {searches:>7} {matches:>7} {seconds * 1000:>10.1f}  {source}")
+
+
+# Visual boxes for findings whose content does not depend on the page,
+# rendered once at import
+
+# Missing age verification
+_AGE_VERIFICATION_BOX = generate_visual_box("MISSING AGE VERIFICATION", [
+    "CHILDREN'S DATA COMPLIANCE CHECK",
+    "",
+    "URL: Children-targeted content detected",
+    "",
+    "DETECTED FLOW:",
+    "  Date of Birth: [NOT COLLECTED]",
+    "                    ↓",
+    "  ✗ NO AGE VERIFICATION",
+    "  ✗ NO GUARDIAN CONSENT FLOW",
+    "  ✗ DIRECT DATA COLLECTION",
+    "",
+    "DPDP Section 9 VIOLATIONS:",
+    "• No verifiable age mechanism",
+    "• No guardian identification",
+    "• No separate consent for child's data",
+    "",
+    "PENALTY RISK: ₹200 crore",
+])
+
+# Missing parental consent
+_PARENTAL_CONSENT_BOX = generate_visual_box("MISSING PARENTAL CONSENT", [
+    "PARENTAL CONSENT COMPLIANCE CHECK",
+    "",
+    "Current State:",
+    "  ✗ No parent/guardian email field",
+    "  ✗ No verifiable consent mechanism",
+    "  ✗ Direct data collection from minor",
+    "",
+    "Required per DPDP Section 9:",
+    "  ✓ Guardian identification",
+    "  ✓ Verifiable consent (email/SMS)",
+    "  ✓ Explicit consent checkbox",
+    "  ✓ Record of guardian consent",
+    "",
+    "PENALTY RISK: ₹200 crore",
+])
+
+# Third-party sharing without a children exemption
+_THIRD_PARTY_SHARING_BOX = generate_visual_box("THIRD-PARTY SHARING ISSUE", [
+    "THIRD-PARTY DATA SHARING ON CHILDREN'S SITE",
+    "",
+    "Issue:",
+    "  Third-party cookies/data sharing detected",
+    "  No exemption for children mentioned",
+    "",
+    "DPDP Section 9 Requirement:",
+    "  Children's data must not be shared",
+    "  for tracking or advertising purposes",
+    "",
+    "PENALTY RISK: ₹200 crore",
+])
+
+# Age/DOB form without a children's notice
+_CHILDREN_NOTICE_BOX = generate_visual_box("MISSING CHILDREN'S NOTICE", [
+    "AGE COLLECTION WITHOUT CHILDREN NOTICE",
+    "",
+    "Issue:",
+    "  Form collects age/DOB",
+    "  No mention of children's data handling",
+    "",
+    "Required Notice:",
+    "  ✗ What happens if user is under 18",
+    "  ✗ Parental consent requirements",
+    "  ✗ Different data handling for minors",
+    "",
+    "DPDP Section 9 Compliance",
+])
+
+# Invariant Finding fields for each check, built once; page-specific fields
+# (location, selector, extra_data) are passed alongside at construction
+
+# Missing age verification on a children-targeted page
+_AGE_VERIFICATION_FINDING = {
+    "check_type": CheckType.CHILDREN_AGE_VERIFICATION,
+    "severity": FindingSeverity.CRITICAL,
+    "status": FindingStatus.FAIL,
+    "title": "No age verification mechanism found",
+    "description": "This appears to be a children-targeted site but lacks age verification. DPDP Section 9 requires verification before processing children's data.",
+    "remediation": "Implement a robust age verification mechanism (age gate, date of birth input) before collecting any personal data.",
+}
+
+# Missing parental consent on a children-targeted page with forms
+_PARENTAL_CONSENT_FINDING = {
+    "check_type": CheckType.CHILDREN_PARENTAL_CONSENT,
+    "severity": FindingSeverity.CRITICAL,
+    "status": FindingStatus.FAIL,
+    "title": "No parental consent mechanism found",
+    "description": "Children-targeted site collects data but lacks verifiable parental consent mechanism. DPDP Section 9 requires parental/guardian consent for processing children's data.",
+    "remediation": "Implement verifiable parental consent: parent email verification, signed consent form, or other approved methods.",
+}
+
+# Tracking on a children-targeted page (description lists what was found)
+_TRACKING_FINDING = {
+    "check_type": CheckType.OTHER,
+    "severity": FindingSeverity.CRITICAL,
+    "status": FindingStatus.FAIL,
+    "title": "Tracking/behavioral advertising detected on children's site",
+    "remediation": "Remove all tracking, analytics, and behavioral advertising from children-targeted sections. Only essential cookies should be used.",
+}
+
+# Third-party cookies/data sharing without a children exemption
+_THIRD_PARTY_SHARING_FINDING = {
+    "check_type": CheckType.OTHER,
+    "severity": FindingSeverity.HIGH,
+    "status": FindingStatus.FAIL,
+    "title": "Third-party data sharing on children's site",
+    "description": "Third-party cookies/data sharing detected without explicit exemption for children's data.",
+    "remediation": "Disable third-party data sharing for users identified as children. Implement age-gated cookie consent.",
+}
+
+# Age/DOB form without a children's data notice
+_CHILDREN_NOTICE_FINDING = {
+    "check_type": CheckType.CHILDREN_DOB_FIELD,
+    "severity": FindingSeverity.MEDIUM,
+    "status": FindingStatus.FAIL,
+    "title": "Age collection without children's data handling notice",
+    "description": "Form collects age/date of birth but doesn't explain how children's data will be handled differently.",
+    "remediation": "Add clear notice about how data will be handled if user is under 18, including parental consent requirements.",
+}
+
+# Page-independent extra_data for each finding, built once; per-page values
+# are merged into a fresh dict at construction
+_AGE_VERIFICATION_EXTRA = {
+    "violation_type": "missing_age_verification",
+    "penalty_risk": "₹200 crore",
+    "visual_representation": _AGE_VERIFICATION_BOX,
+    "required_flow": '''
+REQUIRED CHILDREN'S DATA FLOW:
+┌─────────────────────────────────────────┐
+│  1. Detect age < 18 from DOB            │
+│           ↓                              │
+│  2. Prompt: "Guardian verification"     │
+│           ↓                              │
+│  3. Collect guardian's ID/Email         │
+│           ↓                              │
+│  4. OTP/Email verification to guardian  │
+│           ↓                              │
+│  5. Guardian consent checkbox           │
+│     (NOT pre-selected)                  │
+│           ↓                              │
+│  6. Proceed with data collection        │
+└─────────────────────────────────────────┘''',
+    "code_fix_example": '''
+<!-- Age Verification Gate -->
+<div class="age-gate">
+  <h2>Please verify your age</h2>
+  <label>Date of Birth:</label>
+  <input type="date" id="dob" name="date_of_birth" required>
+  <button onclick="verifyAge()">Verify Age</button>
+</div>
+
+<script>
+function verifyAge() {
+  const dob = new Date(document.getElementById('dob').value);
+  const age = calculateAge(dob);
+  if (age < 18) {
+    showParentalConsentFlow();
+  } else {
+    proceedWithRegistration();
+  }
+}
+</script>''',
+    "dpdp_reference": {
+        "section": "Section 9",
+        "requirement": "Before processing personal data of a child, obtain verifiable consent from parent/guardian",
+        "penalty": "Up to ₹200 crore"
+    },
+    "fix_steps": [
+        "Add date of birth field to registration",
+        "Calculate age and detect minors (< 18)",
+        "Trigger guardian verification flow for minors",
+        "Collect and verify parent/guardian contact",
+        "Send verification to guardian before proceeding",
+        "Require explicit guardian consent checkbox"
+    ],
+}
+
+_PARENTAL_CONSENT_EXTRA = {
+    "violation_type": "missing_parental_consent",
+    "penalty_risk": "₹200 crore",
+    "visual_representation": _PARENTAL_CONSENT_BOX,
+    "code_fix_example": '''
+<!-- Parental Consent Section -->
+<div class="parental-consent" id="guardian-section">
+  <h3>Guardian Verification Required</h3>
+  <p>Since you are under 18, we need your parent/guardian's consent.</p>
+
+  <div class="form-group">
+    <label>Parent/Guardian Name:</label>
+    <input type="text" name="guardian_name" required>
+  </div>
+
+  <div class="form-group">
+    <label>Parent/Guardian Email:</label>
+    <input type="email" name="guardian_email" required>
+  </div>
+
+  <div class="form-group">
+    <label>Relationship:</label>
+    <select name="guardian_relationship">
+      <option value="parent">Parent</option>
+      <option value="guardian">Legal Guardian</option>
+    </select>
+  </div>
+
+  <div class="form-check">
+    <input type="checkbox" id="guardian-consent">
+    <label>I confirm I am the parent/guardian and consent to
+           my child's registration on this platform</label>
+  </div>
+
+  <button onclick="sendVerificationToGuardian()">
+    Send Verification to Guardian
+  </button>
+</div>''',
+    "dpdp_reference": {
+        "section": "Section 9",
+        "requirement": "Verifiable consent from parent/guardian required for children's data",
+        "penalty": "Up to ₹200 crore"
+    },
+    "verification_methods": [
+        "Parent/Guardian email verification with OTP",
+        "SMS verification to guardian mobile",
+        "Signed digital consent form",
+        "Video KYC verification of guardian",
+        "Guardian's government ID verification"
+    ],
+    "fix_steps": [
+        "Add guardian information fields (name, email, mobile)",
+        "Add relationship selector (parent/legal guardian)",
+        "Send verification OTP/link to guardian",
+        "Add explicit consent checkbox for guardian",
+        "Store consent record with timestamp",
+        "Allow guardian to withdraw consent"
+    ],
+}
+
+_TRACKING_EXTRA = {
+    "violation_type": "children_tracking_prohibited",
+    "penalty_risk": "₹200 crore",
+    "dpdp_reference": {
+        "section": "Section 9(3)",
+        "requirement": "No tracking, behavioral monitoring, or targeted advertising for children",
+        "penalty": "Up to ₹200 crore"
+    },
+    "fix_steps": [
+        "Remove Google Analytics from children's pages",
+        "Remove Facebook Pixel and other ad trackers",
+        "Disable personalized advertising",
+        "Use privacy-focused analytics (if needed)",
+        "Implement age-gated tracking (disable for minors)",
+        "Only use essential/functional cookies"
+    ],
+    "scripts_to_remove": [
+        "google-analytics.com/analytics.js",
+        "googletagmanager.com/gtag/js",
+        "connect.facebook.net/en_US/fbevents.js",
+        "static.ads-twitter.com/uwt.js",
+        "All ad network scripts"
+    ],
+}
+
+_THIRD_PARTY_SHARING_EXTRA = {
+    "violation_type": "children_third_party_sharing",
+    "penalty_risk": "₹200 crore",
+    "visual_representation": _THIRD_PARTY_SHARING_BOX,
+    "code_fix_example": '''
+<!-- Age-gated cookie consent -->
+<script>
+function setCookiePreferences(userAge) {
+  if (userAge < 18) {
+    // Disable all non-essential cookies for children
+    disableAnalytics();
+    disableAdvertising();
+    disableThirdPartyCookies();
+    console.log('Third-party cookies disabled for minor user');
+  } else {
+    showCookieConsentBanner();
+  }
+}
+</script>
+
+<!-- Cookie policy update -->
+<p><strong>Children's Privacy:</strong>
+We do not use third-party cookies or share data
+with advertising networks for users under 18.</p>''',
+    "dpdp_reference": {
+        "section": "Section 9",
+        "requirement": "No data sharing for tracking/advertising purposes for children",
+        "penalty": "Up to ₹200 crore"
+    },
+    "fix_steps": [
+        "Implement age detection in cookie consent flow",
+        "Disable third-party cookies for users under 18",
+        "Add explicit exemption for children in privacy policy",
+        "Block advertising network scripts for minors"
+    ],
+}
+
+_CHILDREN_NOTICE_EXTRA = {
+    "violation_type": "missing_children_notice",
+    "penalty_risk": "₹50 crore",
+    "visual_representation": _CHILDREN_NOTICE_BOX,
+    "code_fix_example": '''
+<!-- Add children's data notice near DOB field -->
+<div class="form-group">
+  <label for="dob">Date of Birth *</label>
+  <input type="date" id="dob" name="date_of_birth" required>
+
+  <div class="children-notice">
+    <small>
+      <strong>Important:</strong> If you are under 18 years of age,
+      we will require your parent/guardian's consent before processing
+      your data. Your guardian will be contacted for verification.
+      <a href="/privacy-policy#children">Learn more about children's privacy</a>
+    </small>
+  </div>
+</div>
+
+<!-- Hindi version -->
+<small lang="hi">
+  <strong>महत्वपूर्ण:</strong> यदि आप 18 वर्ष से कम आयु के हैं,
+  तो हमें आपके माता-पिता/अभिभावक की सहमति की आवश्यकता होगी।
+</small>''',
+    "dpdp_reference": {
+        "section": "Section 9",
+        "requirement": "Transparency about children's data processing",
+        "penalty": "Up to ₹200 crore"
+    },
+    "fix_steps": [
+        "Add notice near age/DOB input field",
+        "Explain what happens if user is under 18",
+        "Mention parental consent requirement",
+        "Link to children's privacy section",
+        "Add Hindi translation for Indian users"
+    ],
+}
+
+# Tags the checks below query; collected in one traversal per page
+SCANNED_TAGS = ("input", "select", "script", "form")
+
+# With lxml, only these tags (and their subtrees) are built into the soup;
+# the rest of the document is parsed lazily if a finding needs it
+SCANNED_TAGS_STRAINER = SoupStrainer(SCANNED_TAGS)
+
+
+def collect_elements(soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+    """
+    Bucket every scanned tag by name in a single pass over the tree.
+
+    Inputs and selects are also gathered, in document order, under "field".
+    """
+    elements: Dict[str, List[Tag]] = {name: [] for name in SCANNED_TAGS}
+    fields = elements["field"] = []
+    for element in soup.find_all(SCANNED_TAGS):
+        name = element.name
+        elements[name].append(element)
+        if name == "input" or name == "select":
+            fields.append(element)
+    return elements
+
+
+# Field-name matchers, also usable directly as BeautifulSoup attribute filters
+AGE_FIELD_NAME_RE = re.compile(r"age|dob|birth|year", re.IGNORECASE)
+AGE_SELECT_NAME_RE = re.compile(r"age|year|month|day|birth", re.IGNORECASE)
+PARENT_FIELD_NAME_RE = re.compile(r"parent|guardian|father|mother", re.IGNORECASE)
+
+
+def name_matches(element: Tag, pattern: re.Pattern) -> bool:
+    """Check whether the element has a name attribute matching the pattern."""
+    name = element.get("name")
+    return bool(name) and pattern.search(name) is not None
 
 
 class ChildrenDataDetector(BaseDetector):
@@ -81,6 +549,33 @@ class ChildrenDataDetector(BaseDetector):
         r"अभिभावक.*अनुमति",
     ]
 
+    # Each group is compiled once at class creation into a single alternation,
+    # so the page text is scanned once per group; subclasses extending the
+    # pattern lists should rebuild these. Patterns are written in lowercase and
+    # matched against text that detect() has already lowercased, so no
+    # IGNORECASE flag is needed. Devanagari patterns are split out so they are
+    # skipped on pure-ASCII (English-only) pages.
+    AGE_VERIFICATION_RE = compile_alternation(
+        [p for p in AGE_VERIFICATION_PATTERNS if p.isascii()]
+    )
+    AGE_VERIFICATION_HINDI_RE = compile_alternation(
+        [p for p in AGE_VERIFICATION_PATTERNS if not p.isascii()]
+    )
+    PARENTAL_CONSENT_RE = compile_alternation(
+        [p for p in PARENTAL_CONSENT_PATTERNS if p.isascii()]
+    )
+    PARENTAL_CONSENT_HINDI_RE = compile_alternation(
+        [p for p in PARENTAL_CONSENT_PATTERNS if not p.isascii()]
+    )
+
+    # Every match of the group regex contains at least one of these literals;
+    # when none occur in the text the regex search is skipped
+    AGE_VERIFICATION_LITERALS = (
+        "age", "birth", "dob", "18", "13", "thirteen", "adult", "born",
+        "years old", "आयु", "वर्ष", "साल",
+    )
+    PARENTAL_CONSENT_LITERALS = ("parent", "guardian", "माता-पिता", "अभिभावक")
+
     # Tracking/behavioral advertising indicators
     TRACKING_INDICATORS = [
         "behavioral advertising", "targeted ads", "personalized advertising",
@@ -89,56 +584,191 @@ class ChildrenDataDetector(BaseDetector):
         "व्यवहार विज्ञापन", "लक्षित विज्ञापन",
     ]
 
+    # Maximum characters of page text scanned per page, and how many of those
+    # are taken from the end of the page (see _bounded_text)
+    SCAN_LIMIT = 256 * 1024
+    SCAN_TAIL = 32 * 1024
+
+    # URL fragments that mark a page as children-targeted on their own
+    CHILDREN_URL_PATTERNS = ("kids", "children", "junior", "teen", "youth", "school")
+    CHILDREN_URL_RE = re.compile("|".join(map(re.escape, CHILDREN_URL_PATTERNS)))
+
+    # Script source fragments of known tracking/advertising vendors
+    TRACKING_DOMAINS = (
+        "google-analytics", "googletagmanager", "facebook",
+        "doubleclick", "adsense", "adroll", "criteo",
+        "taboola", "outbrain", "hotjar", "mixpanel",
+    )
+
+    # Third-party cookie wording (all terms must appear) and the exemptions
+    # that show children are excluded from it
+    THIRD_PARTY_COOKIE_TERMS = ("third party", "cookie")
+    CHILDREN_COOKIE_EXEMPTIONS = ("except children", "not for children", "disable for minors")
+
+    # Keyword lookups needed once a page is known to target children; all of
+    # them are answered by a single scan of the page text
+    CHILDREN_SITE_KEYWORD_GROUPS = {
+        "children": CHILDREN_CONTENT_INDICATORS,
+        "tracking": TRACKING_INDICATORS,
+        "age": AGE_VERIFICATION_LITERALS,
+        "consent": PARENTAL_CONSENT_LITERALS,
+        "third_party_cookie": THIRD_PARTY_COOKIE_TERMS,
+        "children_cookie_exemption": CHILDREN_COOKIE_EXEMPTIONS,
+    }
+
+    # Registrable domains of those vendors' script hosts, mapped to the vendor
+    # names above; absolute script URLs are matched by host, not substring
+    TRACKING_HOSTS = {
+        "google-analytics.com": "google-analytics",
+        "googletagmanager.com": "googletagmanager",
+        "facebook.net": "facebook",
+        "facebook.com": "facebook",
+        "doubleclick.net": "doubleclick",
+        "googlesyndication.com": "adsense",
+        "adroll.com": "adroll",
+        "criteo.com": "criteo",
+        "criteo.net": "criteo",
+        "taboola.com": "taboola",
+        "outbrain.com": "outbrain",
+        "hotjar.com": "hotjar",
+        "mixpanel.com": "mixpanel",
+    }
+
+    _pattern_profiler = PatternProfiler({
+        "age": AGE_VERIFICATION_PATTERNS,
+        "consent": PARENTAL_CONSENT_PATTERNS,
+    }) if settings.CHILDREN_PROFILE else None
+
+    # Wording in a form's (lowercased) text that explains how minors are handled
+    CHILDREN_NOTICE_TERMS = (
+        "under 18", "minor", "children", "parental consent", "guardian",
+        "18 years", "18 वर्ष", "नाबालिग", "अभिभावक",
+    )
+
+    # Number of distinct script sources whose tracking vendors are kept in memory
+    TRACKING_SRC_CACHE_SIZE = 2048
+
+    _kids_automaton = build_keyword_automaton(CHILDREN_CONTENT_INDICATORS)
+    _notice_automaton = build_keyword_automaton(CHILDREN_NOTICE_TERMS)
+    _tracking_domain_automaton = build_keyword_automaton(TRACKING_DOMAINS)
+    _children_site_automaton = build_group_automaton(CHILDREN_SITE_KEYWORD_GROUPS)
+
     async def detect(self, page: CrawledPage) -> List[Finding]:
         """Detect children's data protection issues on the page."""
+        # Parsing and pattern matching are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self._detect_sync, page)
+
+    def _detect_sync(self, page: CrawledPage) -> List[Finding]:
+        """Run all children's data checks on the page synchronously."""
         findings = []
 
-        soup = BeautifulSoup(page.html_content, "html.parser")
-        text_content = soup.get_text().lower()
+        if HTML_PARSER == "lxml":
+            # The text is read by lxml directly, before any tree is built
+            soup = None
+            lower_text = page.get_lower_text()
+        else:
+            soup = parse_html(page.html_content)
+            lower_text = page.get_lower_text(soup)
+
+        # Lowercased text and the children-targeting verdict are cached on the
+        # page so repeat scans (and other detectors) reuse them
+        text_content = self._bounded_text(lower_text)
 
         # Check if this appears to be children-targeted content
-        is_children_site = self._is_children_targeted(text_content, page.url)
+        cache = page.analysis_cache
+        is_children_site = cache.get("is_children_site")
+        if is_children_site is None:
+            is_children_site = cache["is_children_site"] = self._is_children_targeted(
+                text_content, page.url
+            )
+
+        # Other pages only get the age-collection form check; without a form
+        # tag in the markup there is nothing to query
+        if not is_children_site and FORM_TAG_RE.search(page.html_content) is None:
+            return findings
+
+        if soup is None:
+            # Partial tree of the queried tags only
+            soup = BeautifulSoup(
+                page.html_content, HTML_PARSER, parse_only=SCANNED_TAGS_STRAINER
+            )
+        elements = collect_elements(soup)
+
+        # The complete tree is only needed for some findings; parse it at most
+        # once per page, and not at all when soup already is complete
+        document = soup if soup.parse_only is None else None
+
+        def get_document() -> BeautifulSoup:
+            nonlocal document
+            if document is None:
+                document = parse_html(page.html_content)
+            return document
 
         if is_children_site:
+            keyword_hits = find_group_keywords(
+                self._children_site_automaton,
+                self.CHILDREN_SITE_KEYWORD_GROUPS,
+                text_content,
+            )
+            if self._pattern_profiler is not None:
+                self._pattern_profiler.record(text_content)
+
             # Check for age verification
-            age_findings = self._check_age_verification(soup, text_content, page)
+            age_findings = self._check_age_verification(
+                get_document, elements, keyword_hits, text_content, page
+            )
             findings.extend(age_findings)
 
             # Check for parental consent mechanism
-            consent_findings = self._check_parental_consent(soup, text_content, page)
+            consent_findings = self._check_parental_consent(
+                elements, keyword_hits, text_content, page
+            )
             findings.extend(consent_findings)
 
             # Check for prohibited tracking
-            tracking_findings = self._check_tracking_prohibition(soup, text_content, page)
+            tracking_findings = self._check_tracking_prohibition(
+                get_document, elements, keyword_hits, text_content, page
+            )
             findings.extend(tracking_findings)
 
         # Check forms that collect age/DOB
-        form_findings = self._check_age_collection_forms(soup, page)
+        form_findings = self._check_age_collection_forms(elements, page)
         findings.extend(form_findings)
 
         return findings
 
+    def _bounded_text(self, text: str) -> str:
+        """
+        Limit text to SCAN_LIMIT characters, keeping the head and a SCAN_TAIL tail.
+
+        Age gates, consent wording and cookie/tracking notices sit near the
+        top of the page or in the footer, so very long pages (catalogues,
+        SPA dumps) are scanned at bounded cost. The parts are joined by a
+        newline so no pattern matches across the cut.
+        """
+        if len(text) <= self.SCAN_LIMIT:
+            return text
+        head = self.SCAN_LIMIT - self.SCAN_TAIL
+        return f"{text[:head]}\n{text[-self.SCAN_TAIL:]}"
+
     def _is_children_targeted(self, text_content: str, url: str) -> bool:
         """Determine if the site/page is targeted at children."""
         url_lower = url.lower()
 
         # Check URL patterns
-        children_url_patterns = ["kids", "children", "junior", "teen", "youth", "school"]
-        if any(pattern in url_lower for pattern in children_url_patterns):
+        if self.CHILDREN_URL_RE.search(url_lower):
             return True
 
-        # Check content for children indicators
-        indicator_count = sum(
-            1 for indicator in self.CHILDREN_CONTENT_INDICATORS
-            if indicator in text_content
-        )
-
         # If multiple indicators found, likely children-targeted
-        return indicator_count >= 3
+        return has_keywords(
+            self._kids_automaton, self.CHILDREN_CONTENT_INDICATORS, text_content, 3
+        )
 
     def _check_age_verification(
         self,
-        soup: BeautifulSoup,
+        get_document: Callable[[], BeautifulSoup],
+        elements: Dict[str, List[Tag]],
+        keyword_hits: Dict[str, Set[str]],
         text_content: str,
         page: CrawledPage,
     ) -> List[Finding]:
@@ -146,129 +776,52 @@ class ChildrenDataDetector(BaseDetector):
         findings = []
 
         # Look for age verification patterns
-        has_age_verification = any(
-            re.search(pattern, text_content, re.IGNORECASE)
-            for pattern in self.AGE_VERIFICATION_PATTERNS
+        has_age_verification = (
+            bool(keyword_hits["age"])
+            and (
+                self.AGE_VERIFICATION_RE.search(text_content) is not None
+                or (
+                    not text_content.isascii()
+                    and self.AGE_VERIFICATION_HINDI_RE.search(text_content) is not None
+                )
+            )
         )
 
         # Look for age input fields
-        age_inputs = soup.find_all("input", attrs={
-            "type": lambda x: x in ["date", "number", "text"],
-            "name": lambda x: x and any(
-                term in x.lower() for term in ["age", "dob", "birth", "year"]
-            ) if x else False,
-        })
+        age_inputs = [
+            element for element in elements["input"]
+            if element.get("type") in ("date", "number", "text")
+            and name_matches(element, AGE_FIELD_NAME_RE)
+        ]
 
         # Check for age dropdown/select
-        age_selects = soup.find_all("select", attrs={
-            "name": lambda x: x and any(
-                term in x.lower() for term in ["age", "year", "month", "day", "birth"]
-            ) if x else False,
-        })
+        age_selects = [
+            element for element in elements["select"]
+            if name_matches(element, AGE_SELECT_NAME_RE)
+        ]
 
         has_age_inputs = len(age_inputs) > 0 or len(age_selects) > 0
 
         if not has_age_verification and not has_age_inputs:
             # Find an element to highlight (form or main content area)
-            form = soup.find("form")
-            main_content = soup.find("main") or soup.find("div", class_=lambda x: x and "content" in str(x).lower()) or soup.find("body")
-            element_for_screenshot = form or main_content
+            element_for_screenshot = elements["form"][0] if elements["form"] else None
+            if element_for_screenshot is None:
+                document = get_document()
+                element_for_screenshot = document.find("main") or document.find("div", class_=lambda x: x and "content" in str(x).lower()) or document.find("body")
             element_selector = generate_css_selector(element_for_screenshot) if element_for_screenshot else "body"
 
-            # Visual representation for children's data flow
-            visual_content = [
-                "CHILDREN'S DATA COMPLIANCE CHECK",
-                "",
-                "URL: Children-targeted content detected",
-                "",
-                "DETECTED FLOW:",
-                "  Date of Birth: [NOT COLLECTED]",
-                "                    ↓",
-                "  ✗ NO AGE VERIFICATION",
-                "  ✗ NO GUARDIAN CONSENT FLOW",
-                "  ✗ DIRECT DATA COLLECTION",
-                "",
-                "DPDP Section 9 VIOLATIONS:",
-                "• No verifiable age mechanism",
-                "• No guardian identification",
-                "• No separate consent for child's data",
-                "",
-                "PENALTY RISK: ₹200 crore",
-            ]
-            visual_box = generate_visual_box("MISSING AGE VERIFICATION", visual_content)
-
-            # Required flow example
-            required_flow = '''
-REQUIRED CHILDREN'S DATA FLOW:
-┌─────────────────────────────────────────┐
-│  1. Detect age < 18 from DOB            │
-│           ↓                              │
-│  2. Prompt: "Guardian verification"     │
-│           ↓                              │
-│  3. Collect guardian's ID/Email         │
-│           ↓                              │
-│  4. OTP/Email verification to guardian  │
-│           ↓                              │
-│  5. Guardian consent checkbox           │
-│     (NOT pre-selected)                  │
-│           ↓                              │
-│  6. Proceed with data collection        │
-└─────────────────────────────────────────┘'''
-
-            code_fix_example = '''
-<!-- Age Verification Gate -->
-<div class="age-gate">
-  <h2>Please verify your age</h2>
-  <label>Date of Birth:</label>
-  <input type="date" id="dob" name="date_of_birth" required>
-  <button onclick="verifyAge()">Verify Age</button>
-</div>
-
-<script>
-function verifyAge() {
-  const dob = new Date(document.getElementById('dob').value);
-  const age = calculateAge(dob);
-  if (age < 18) {
-    showParentalConsentFlow();
-  } else {
-    proceedWithRegistration();
-  }
-}
-</script>'''
-
             findings.append(Finding(
-                check_type=CheckType.CHILDREN_AGE_VERIFICATION,
-                severity=FindingSeverity.CRITICAL,
-                status=FindingStatus.FAIL,
-                title="No age verification mechanism found",
-                description="This appears to be a children-targeted site but lacks age verification. DPDP Section 9 requires verification before processing children's data.",
+                **_AGE_VERIFICATION_FINDING,
                 location=page.url,
                 element_selector=element_selector,
                 dpdp_section=self.dpdp_section,
-                remediation="Implement a robust age verification mechanism (age gate, date of birth input) before collecting any personal data.",
                 extra_data={
-                    "violation_type": "missing_age_verification",
+                    **_AGE_VERIFICATION_EXTRA,
+                    # Reported in declaration order, from the hits already found
                     "children_indicators_found": [
                         ind for ind in self.CHILDREN_CONTENT_INDICATORS
-                        if ind in text_content
+                        if ind in keyword_hits["children"]
                     ][:5],
-                    "penalty_risk": "₹200 crore",
-                    "visual_representation": visual_box,
-                    "required_flow": required_flow,
-                    "code_fix_example": code_fix_example,
-                    "dpdp_reference": {
-                        "section": "Section 9",
-                        "requirement": "Before processing personal data of a child, obtain verifiable consent from parent/guardian",
-                        "penalty": "Up to ₹200 crore"
-                    },
-                    "fix_steps": [
-                        "Add date of birth field to registration",
-                        "Calculate age and detect minors (< 18)",
-                        "Trigger guardian verification flow for minors",
-                        "Collect and verify parent/guardian contact",
-                        "Send verification to guardian before proceeding",
-                        "Require explicit guardian consent checkbox"
-                    ]
                 }
             ))
 
@@ -276,7 +829,8 @@ function verifyAge() {
 
     def _check_parental_consent(
         self,
-        soup: BeautifulSoup,
+        elements: Dict[str, List[Tag]],
+        keyword_hits: Dict[str, Set[str]],
         text_content: str,
         page: CrawledPage,
     ) -> List[Finding]:
@@ -284,117 +838,39 @@ function verifyAge() {
         findings = []
 
         # Look for parental consent patterns
-        has_parental_consent = any(
-            re.search(pattern, text_content, re.IGNORECASE)
-            for pattern in self.PARENTAL_CONSENT_PATTERNS
+        has_parental_consent = (
+            bool(keyword_hits["consent"])
+            and (
+                self.PARENTAL_CONSENT_RE.search(text_content) is not None
+                or (
+                    not text_content.isascii()
+                    and self.PARENTAL_CONSENT_HINDI_RE.search(text_content) is not None
+                )
+            )
         )
 
         # Look for parent email/contact fields
-        parent_fields = soup.find_all("input", attrs={
-            "name": lambda x: x and any(
-                term in x.lower() for term in ["parent", "guardian", "father", "mother"]
-            ) if x else False,
-        })
+        parent_fields = [
+            element for element in elements["input"]
+            if name_matches(element, PARENT_FIELD_NAME_RE)
+        ]
 
         if not has_parental_consent and len(parent_fields) == 0:
             # Check if there's data collection happening
-            has_forms = len(soup.find_all("form")) > 0
+            forms = elements["form"]
 
-            if has_forms:
+            if forms:
                 # Find form element for screenshot
-                form = soup.find("form")
-                form_selector = generate_css_selector(form) if form else "body"
-
-                # Visual representation
-                visual_content = [
-                    "PARENTAL CONSENT COMPLIANCE CHECK",
-                    "",
-                    "Current State:",
-                    "  ✗ No parent/guardian email field",
-                    "  ✗ No verifiable consent mechanism",
-                    "  ✗ Direct data collection from minor",
-                    "",
-                    "Required per DPDP Section 9:",
-                    "  ✓ Guardian identification",
-                    "  ✓ Verifiable consent (email/SMS)",
-                    "  ✓ Explicit consent checkbox",
-                    "  ✓ Record of guardian consent",
-                    "",
-                    "PENALTY RISK: ₹200 crore",
-                ]
-                visual_box = generate_visual_box("MISSING PARENTAL CONSENT", visual_content)
-
-                code_fix_example = '''
-<!-- Parental Consent Section -->
-<div class="parental-consent" id="guardian-section">
-  <h3>Guardian Verification Required</h3>
-  <p>Since you are under 18, we need your parent/guardian's consent.</p>
-
-  <div class="form-group">
-    <label>Parent/Guardian Name:</label>
-    <input type="text" name="guardian_name" required>
-  </div>
-
-  <div class="form-group">
-    <label>Parent/Guardian Email:</label>
-    <input type="email" name="guardian_email" required>
-  </div>
-
-  <div class="form-group">
-    <label>Relationship:</label>
-    <select name="guardian_relationship">
-      <option value="parent">Parent</option>
-      <option value="guardian">Legal Guardian</option>
-    </select>
-  </div>
-
-  <div class="form-check">
-    <input type="checkbox" id="guardian-consent">
-    <label>I confirm I am the parent/guardian and consent to
-           my child's registration on this platform</label>
-  </div>
-
-  <button onclick="sendVerificationToGuardian()">
-    Send Verification to Guardian
-  </button>
-</div>'''
+                form_selector = generate_css_selector(forms[0])
 
                 findings.append(Finding(
-                    check_type=CheckType.CHILDREN_PARENTAL_CONSENT,
-                    severity=FindingSeverity.CRITICAL,
-                    status=FindingStatus.FAIL,
-                    title="No parental consent mechanism found",
-                    description="Children-targeted site collects data but lacks verifiable parental consent mechanism. DPDP Section 9 requires parental/guardian consent for processing children's data.",
+                    **_PARENTAL_CONSENT_FINDING,
                     location=page.url,
                     element_selector=form_selector,
                     dpdp_section=self.dpdp_section,
-                    remediation="Implement verifiable parental consent: parent email verification, signed consent form, or other approved methods.",
                     extra_data={
-                        "violation_type": "missing_parental_consent",
-                        "forms_count": len(soup.find_all("form")),
-                        "penalty_risk": "₹200 crore",
-                        "visual_representation": visual_box,
-                        "code_fix_example": code_fix_example,
-                        "dpdp_reference": {
-                            "section": "Section 9",
-                            "requirement": "Verifiable consent from parent/guardian required for children's data",
-                            "penalty": "Up to ₹200 crore"
-                        },
-                        "verification_methods": [
-                            "Parent/Guardian email verification with OTP",
-                            "SMS verification to guardian mobile",
-                            "Signed digital consent form",
-                            "Video KYC verification of guardian",
-                            "Guardian's government ID verification"
-                        ],
-                        "fix_steps": [
-                            "Add guardian information fields (name, email, mobile)",
-                            "Add relationship selector (parent/legal guardian)",
-                            "Send verification OTP/link to guardian",
-                            "Add explicit consent checkbox for guardian",
-                            "Store consent record with timestamp",
-                            "Allow guardian to withdraw consent"
-                        ]
+                        **_PARENTAL_CONSENT_EXTRA,
+                        "forms_count": len(forms),
                     }
                 ))
 
@@ -402,7 +878,9 @@ function verifyAge() {
 
     def _check_tracking_prohibition(
         self,
-        soup: BeautifulSoup,
+        get_document: Callable[[], BeautifulSoup],
+        elements: Dict[str, List[Tag]],
+        keyword_hits: Dict[str, Set[str]],
         text_content: str,
         page: CrawledPage,
     ) -> List[Finding]:
@@ -410,26 +888,28 @@ function verifyAge() {
         findings = []
 
         # Check for tracking indicators
-        tracking_found = []
-        for indicator in self.TRACKING_INDICATORS:
-            if indicator in text_content:
-                tracking_found.append(indicator)
+        tracking_found = [
+            indicator for indicator in self.TRACKING_INDICATORS
+            if indicator in keyword_hits["tracking"]
+        ]
 
         # Check for tracking scripts
-        scripts = soup.find_all("script", src=True)
-        tracking_scripts = []
-
-        tracking_domains = [
-            "google-analytics", "googletagmanager", "facebook",
-            "doubleclick", "adsense", "adroll", "criteo",
-            "taboola", "outbrain", "hotjar", "mixpanel",
+        scripts = [
+            script for script in elements["script"]
+            if script.get("src") is not None
         ]
+        tracking_script_elements = []
+        tracking_scripts = []
 
         for script in scripts:
-            src = script.get("src", "").lower()
-            for domain in tracking_domains:
-                if domain in src:
-                    tracking_scripts.append(domain)
+            domains = self._tracking_vendors(script.get("src", ""))
+            if domains:
+                tracking_script_elements.append(script)
+                # Each vendor is reported once, in order of first appearance
+                tracking_scripts.extend(
+                    domain for domain in self.TRACKING_DOMAINS
+                    if domain in domains and domain not in tracking_scripts
+                )
 
         if tracking_found or tracking_scripts:
             all_tracking = tracking_found + tracking_scripts
@@ -457,235 +937,117 @@ function verifyAge() {
 
             # Find the first tracking script element for screenshot
             element_selector = None
-            if tracking_scripts and scripts:
-                for script in scripts:
-                    src = script.get("src", "").lower()
-                    for domain in tracking_domains:
-                        if domain in src:
-                            element_selector = generate_css_selector(script)
-                            break
-                    if element_selector:
-                        break
+            for script in tracking_script_elements:
+                element_selector = generate_css_selector(script)
+                if element_selector:
+                    break
 
             # If no script found, try to find any script tag or body
             if not element_selector:
-                first_script = soup.find("script", src=True)
-                if first_script:
-                    element_selector = generate_css_selector(first_script)
+                if scripts:
+                    element_selector = generate_css_selector(scripts[0])
                 else:
                     # Use body as fallback for viewport screenshot
                     element_selector = "body"
 
             findings.append(Finding(
-                check_type=CheckType.OTHER,
-                severity=FindingSeverity.CRITICAL,
-                status=FindingStatus.FAIL,
-                title="Tracking/behavioral advertising detected on children's site",
+                **_TRACKING_FINDING,
                 description=f"DPDP Section 9 prohibits tracking, behavioral monitoring, and targeted advertising for children. Found: {', '.join(all_tracking)[:200]}",
                 location=page.url,
                 element_selector=element_selector,
                 dpdp_section=self.dpdp_section,
-                remediation="Remove all tracking, analytics, and behavioral advertising from children-targeted sections. Only essential cookies should be used.",
                 extra_data={
-                    "violation_type": "children_tracking_prohibited",
+                    **_TRACKING_EXTRA,
                     "trackers_found": all_tracking,
                     "tracking_scripts": tracking_scripts,
                     "tracking_text": tracking_found,
-                    "penalty_risk": "₹200 crore",
                     "visual_representation": visual_box,
-                    "dpdp_reference": {
-                        "section": "Section 9(3)",
-                        "requirement": "No tracking, behavioral monitoring, or targeted advertising for children",
-                        "penalty": "Up to ₹200 crore"
-                    },
-                    "fix_steps": [
-                        "Remove Google Analytics from children's pages",
-                        "Remove Facebook Pixel and other ad trackers",
-                        "Disable personalized advertising",
-                        "Use privacy-focused analytics (if needed)",
-                        "Implement age-gated tracking (disable for minors)",
-                        "Only use essential/functional cookies"
-                    ],
-                    "scripts_to_remove": [
-                        "google-analytics.com/analytics.js",
-                        "googletagmanager.com/gtag/js",
-                        "connect.facebook.net/en_US/fbevents.js",
-                        "static.ads-twitter.com/uwt.js",
-                        "All ad network scripts"
-                    ]
                 }
             ))
 
         # Check for third-party cookies mention without exception for children
-        cookie_text = text_content
-        if "third party" in cookie_text and "cookie" in cookie_text:
-            if not any(term in cookie_text for term in ["except children", "not for children", "disable for minors"]):
+        if len(keyword_hits["third_party_cookie"]) == len(self.THIRD_PARTY_COOKIE_TERMS):
+            if not keyword_hits["children_cookie_exemption"]:
                 # Find element containing cookie text for screenshot
-                cookie_element = soup.find(string=lambda t: t and "third party" in t.lower() and "cookie" in t.lower())
+                document = get_document()
+                cookie_element = document.find(string=lambda t: t and "third party" in t.lower() and "cookie" in t.lower())
                 cookie_selector = "body"
                 if cookie_element and cookie_element.parent:
                     cookie_selector = generate_css_selector(cookie_element.parent)
 
-                visual_content = [
-                    "THIRD-PARTY DATA SHARING ON CHILDREN'S SITE",
-                    "",
-                    "Issue:",
-                    "  Third-party cookies/data sharing detected",
-                    "  No exemption for children mentioned",
-                    "",
-                    "DPDP Section 9 Requirement:",
-                    "  Children's data must not be shared",
-                    "  for tracking or advertising purposes",
-                    "",
-                    "PENALTY RISK: ₹200 crore",
-                ]
-                visual_box = generate_visual_box("THIRD-PARTY SHARING ISSUE", visual_content)
-
                 findings.append(Finding(
-                    check_type=CheckType.OTHER,
-                    severity=FindingSeverity.HIGH,
-                    status=FindingStatus.FAIL,
-                    title="Third-party data sharing on children's site",
-                    description="Third-party cookies/data sharing detected without explicit exemption for children's data.",
+                    **_THIRD_PARTY_SHARING_FINDING,
                     location=page.url,
                     element_selector=cookie_selector,
                     dpdp_section=self.dpdp_section,
-                    remediation="Disable third-party data sharing for users identified as children. Implement age-gated cookie consent.",
-                    extra_data={
-                        "violation_type": "children_third_party_sharing",
-                        "penalty_risk": "₹200 crore",
-                        "visual_representation": visual_box,
-                        "code_fix_example": '''
-<!-- Age-gated cookie consent -->
-<script>
-function setCookiePreferences(userAge) {
-  if (userAge < 18) {
-    // Disable all non-essential cookies for children
-    disableAnalytics();
-    disableAdvertising();
-    disableThirdPartyCookies();
-    console.log('Third-party cookies disabled for minor user');
-  } else {
-    showCookieConsentBanner();
-  }
-}
-</script>
-
-<!-- Cookie policy update -->
-<p><strong>Children's Privacy:</strong>
-We do not use third-party cookies or share data
-with advertising networks for users under 18.</p>''',
-                        "dpdp_reference": {
-                            "section": "Section 9",
-                            "requirement": "No data sharing for tracking/advertising purposes for children",
-                            "penalty": "Up to ₹200 crore"
-                        },
-                        "fix_steps": [
-                            "Implement age detection in cookie consent flow",
-                            "Disable third-party cookies for users under 18",
-                            "Add explicit exemption for children in privacy policy",
-                            "Block advertising network scripts for minors"
-                        ]
-                    }
+                    extra_data=dict(_THIRD_PARTY_SHARING_EXTRA),
                 ))
 
         return findings
 
+    @staticmethod
+    @lru_cache(maxsize=TRACKING_SRC_CACHE_SIZE)
+    def _tracking_vendors(src: str) -> FrozenSet[str]:
+        """
+        Identify the tracking vendors a script source loads from.
+
+        Pages of one site load the same scripts, so results are cached by
+        source across pages and scans.
+        """
+        detector = ChildrenDataDetector
+        src = src.strip().lower()
+        try:
+            host = urlparse(src).hostname
+        except ValueError:
+            host = None
+
+        if host:
+            vendor = match_host(host, detector.TRACKING_HOSTS)
+            return frozenset((vendor,)) if vendor else frozenset()
+
+        # Relative sources are self-hosted or proxied copies; match by name
+        return frozenset(find_keywords(
+            detector._tracking_domain_automaton, detector.TRACKING_DOMAINS, src
+        ))
+
     def _check_age_collection_forms(
         self,
-        soup: BeautifulSoup,
+        elements: Dict[str, List[Tag]],
         page: CrawledPage,
     ) -> List[Finding]:
         """Check forms that collect age/DOB for proper handling."""
         findings = []
 
-        forms = soup.find_all("form")
+        # Assign each age/DOB field to every form it sits in, from the field
+        # list collected in detect(), instead of walking each form's subtree
+        age_fields_by_form: Dict[int, List[Tag]] = {id(form): [] for form in elements["form"]}
+        for field in elements["field"]:
+            if name_matches(field, AGE_FIELD_NAME_RE):
+                for parent in field.parents:
+                    if parent.name == "form":
+                        age_fields_by_form[id(parent)].append(field)
 
-        for form in forms:
+        for form in elements["form"]:
             # Find age/DOB fields
-            age_fields = form.find_all(["input", "select"], attrs={
-                "name": lambda x: x and any(
-                    term in x.lower() for term in ["age", "dob", "birth", "year"]
-                ) if x else False,
-            })
+            age_fields = age_fields_by_form[id(form)]
 
             if age_fields:
                 # Check if there's accompanying text about children's data
                 form_text = form.get_text().lower()
 
-                has_children_notice = any(
-                    term in form_text for term in [
-                        "under 18", "minor", "children", "parental consent",
-                        "guardian", "18 years",
-                        "18 वर्ष", "नाबालिग", "अभिभावक",
-                    ]
+                has_children_notice = has_keywords(
+                    self._notice_automaton, self.CHILDREN_NOTICE_TERMS, form_text, 1
                 )
 
                 if not has_children_notice:
-                    visual_content = [
-                        "AGE COLLECTION WITHOUT CHILDREN NOTICE",
-                        "",
-                        "Issue:",
-                        "  Form collects age/DOB",
-                        "  No mention of children's data handling",
-                        "",
-                        "Required Notice:",
-                        "  ✗ What happens if user is under 18",
-                        "  ✗ Parental consent requirements",
-                        "  ✗ Different data handling for minors",
-                        "",
-                        "DPDP Section 9 Compliance",
-                    ]
-                    visual_box = generate_visual_box("MISSING CHILDREN'S NOTICE", visual_content)
-
                     findings.append(Finding(
-                        check_type=CheckType.CHILDREN_DOB_FIELD,
-                        severity=FindingSeverity.MEDIUM,
-                        status=FindingStatus.FAIL,
-                        title="Age collection without children's data handling notice",
-                        description="Form collects age/date of birth but doesn't explain how children's data will be handled differently.",
+                        **_CHILDREN_NOTICE_FINDING,
                         location=page.url,
                         element_selector=generate_css_selector(form),
                         dpdp_section=self.dpdp_section,
-                        remediation="Add clear notice about how data will be handled if user is under 18, including parental consent requirements.",
                         extra_data={
-                            "violation_type": "missing_children_notice",
+                            **_CHILDREN_NOTICE_EXTRA,
                             "age_fields_found": [str(f.get("name", "unnamed")) for f in age_fields],
-                            "penalty_risk": "₹50 crore",
-                            "visual_representation": visual_box,
-                            "code_fix_example": '''
-<!-- Add children's data notice near DOB field -->
-<div class="form-group">
-  <label for="dob">Date of Birth *</label>
-  <input type="date" id="dob" name="date_of_birth" required>
-
-  <div class="children-notice">
-    <small>
-      <strong>Important:</strong> If you are under 18 years of age,
-      we will require your parent/guardian's consent before processing
-      your data. Your guardian will be contacted for verification.
-      <a href="/privacy-policy#children">Learn more about children's privacy</a>
-    </small>
-  </div>
-</div>
-
-<!-- Hindi version -->
-<small lang="hi">
-  <strong>महत्वपूर्ण:</strong> यदि आप 18 वर्ष से कम आयु के हैं,
-  तो हमें आपके माता-पिता/अभिभावक की सहमति की आवश्यकता होगी।
-</small>''',
-                            "dpdp_reference": {
-                                "section": "Section 9",
-                                "requirement": "Transparency about children's data processing",
-                                "penalty": "Up to ₹200 crore"
-                            },
-                            "fix_steps": [
-                                "Add notice near age/DOB input field",
-                                "Explain what happens if user is under 18",
-                                "Mention parental consent requirement",
-                                "Link to children's privacy section",
-                                "Add Hindi translation for Indian users"
-                            ]
                         }
                     ))
 
@@ -4,11 +4,22 @@ DPDP GUI Compliance Scanner - Consent Mechanism Detector
 Detects consent mechanism compliance issues per DPDP Section 6.
 Based on Real-Time-Examples-Scenarios.md format for detailed findings.
 """
+import asyncio
 import re
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup, Tag
-
-from app.detectors.base import BaseDetector, generate_css_selector
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from app.detectors.base import (
+    FORM_TAG_RE,
+    BaseDetector,
+    build_group_automaton,
+    build_keyword_automaton,
+    find_group_keywords,
+    generate_css_selector,
+    has_keywords,
+    parse_html,
+)
 from app.models.finding import CheckType, Finding, FindingSeverity, FindingStatus
 from app.scanners.web.crawler import CrawledPage
 
@@ -34,6 +45,75 @@ def generate_visual_box(title: str, content_lines: List[str], width: int = 60) -
     return "\n".join(lines)
 
 
+@dataclass
+class CheckboxContext:
+    """A checkbox with the lowercased text the consent checks read around it."""
+    element: Tag
+    element_id: Optional[str]
+    label_text: str
+    parent_text: str
+
+    @property
+    def combined_text(self) -> str:
+        return self.label_text + " " + self.parent_text
+
+
+def element_text(element: Tag) -> str:
+    """
+    Get an element's text as get_text() returns it.
+
+    Most labels hold a single plain string, which is returned directly
+    instead of walking the subtree; comments, script and other special
+    strings still go through get_text(), which skips them.
+    """
+    contents = element.contents
+    if len(contents) == 1 and type(contents[0]) is NavigableString:
+        return str(contents[0])
+    return element.get_text()
+
+
+def collect_checkboxes(soup: BeautifulSoup) -> List[CheckboxContext]:
+    """
+    Gather every checkbox with its label and parent text in a single pass.
+
+    Labels are indexed by their "for" attribute (first label wins, as with
+    soup.find) instead of being searched for once per checkbox, and the text
+    of a label or parent shared by several checkboxes is extracted once.
+    """
+    checkboxes: List[Tag] = []
+    labels: Dict[str, Tag] = {}
+    for element in soup.find_all(["input", "label"]):
+        if element.name == "input":
+            if element.get("type") == "checkbox":
+                checkboxes.append(element)
+        else:
+            target = element.get("for")
+            if target and target not in labels:
+                labels[target] = element
+
+    # Lowercased text by element id, for labels and parents seen before
+    texts: Dict[int, str] = {}
+
+    def lower_text(element: Optional[Tag]) -> str:
+        if element is None:
+            return ""
+        text = texts.get(id(element))
+        if text is None:
+            text = texts[id(element)] = element_text(element).lower()
+        return text
+
+    contexts = []
+    for cb in checkboxes:
+        label_id = cb.get("id")
+        contexts.append(CheckboxContext(
+            element=cb,
+            element_id=label_id,
+            label_text=lower_text(labels.get(label_id) if label_id else None),
+            parent_text=lower_text(cb.parent),
+        ))
+    return contexts
+
+
 class ConsentDetector(BaseDetector):
     """
     Detector for DPDP Section 6 - Consent Requirements.
@@ -55,27 +135,67 @@ class ConsentDetector(BaseDetector):
         "सहमति", "स्वीकार", "मैं सहमत हूं",
     ]
 
+    # Keywords that indicate different consent purposes
+    PURPOSE_GROUPS = {
+        "marketing": ["marketing", "promotional", "newsletter", "offers"],
+        "analytics": ["analytics", "tracking", "statistics"],
+        "sharing": ["third party", "partner", "share"],
+        "personalization": ["personalization", "recommendations"],
+    }
+
+    # Keywords for withdrawal mechanism
+    WITHDRAWAL_KEYWORDS = [
+        "withdraw consent", "revoke consent", "opt out", "opt-out",
+        "unsubscribe", "manage preferences", "privacy settings",
+        "सहमति वापस", "ऑप्ट आउट", "अनसब्सक्राइब",
+    ]
+
+    # Inline style or class wording that hides an element ("hidden" also
+    # covers visibility: hidden and class names such as visually-hidden)
+    HIDDEN_STYLE_RE = re.compile(r"hidden|display: ?none|opacity: ?0")
+
+    # Cookie banner wording for an accept option and for a reject option
+    BANNER_ACCEPT_RE = re.compile(r"accept|agree")
+    BANNER_REJECT_RE = re.compile(r"reject|decline|refuse")
+
+    _consent_automaton = build_keyword_automaton(CONSENT_KEYWORDS)
+    _purpose_automaton = build_group_automaton(PURPOSE_GROUPS)
+    _withdrawal_automaton = build_keyword_automaton(WITHDRAWAL_KEYWORDS)
+
     async def detect(self, page: CrawledPage) -> List[Finding]:
         """Detect consent mechanism issues on the page."""
+        # Parsing and keyword matching are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self._detect_sync, page)
+
+    def _detect_sync(self, page: CrawledPage) -> List[Finding]:
+        """Run all consent checks on the page synchronously."""
         findings = []
 
-        soup = BeautifulSoup(page.html_content, "html.parser")
+        # The markup checks need a checkbox or a form; pages with neither
+        # (articles, listings) are not parsed at all
+        html = page.html_content
+        if "checkbox" in html or FORM_TAG_RE.search(html) is not None:
+            soup = parse_html(html)
+
+            # Checkboxes, their labels and surrounding text are gathered once
+            # and shared by the checkbox checks below
+            checkboxes = collect_checkboxes(soup)
 
-        # Check for pre-checked consent checkboxes
-        prechecked = self._detect_prechecked_consent(soup, page)
-        findings.extend(prechecked)
+            # Check for pre-checked consent checkboxes
+            prechecked = self._detect_prechecked_consent(checkboxes, page)
+            findings.extend(prechecked)
 
-        # Check for bundled consent
-        bundled = self._detect_bundled_consent(soup, page)
-        findings.extend(bundled)
+            # Check for bundled consent
+            bundled = self._detect_bundled_consent(checkboxes, page)
+            findings.extend(bundled)
 
-        # Check for hidden consent
-        hidden = self._detect_hidden_consent(soup, page)
-        findings.extend(hidden)
+            # Check for hidden consent
+            hidden = self._detect_hidden_consent(checkboxes, page)
+            findings.extend(hidden)
 
-        # Check consent withdrawal mechanism
-        withdrawal = self._detect_withdrawal_issues(soup, page)
-        findings.extend(withdrawal)
+            # Check consent withdrawal mechanism
+            withdrawal = self._detect_withdrawal_issues(soup, page)
+            findings.extend(withdrawal)
 
         # Check cookie consent
         cookie_findings = self._detect_cookie_consent_issues(page)
@@ -83,28 +203,23 @@ class ConsentDetector(BaseDetector):
 
         return findings
 
-    def _detect_prechecked_consent(self, soup: BeautifulSoup, page: CrawledPage) -> List[Finding]:
+    def _has_consent_keyword(self, text: str) -> bool:
+        """Check whether text mentions any consent keyword."""
+        return has_keywords(self._consent_automaton, self.CONSENT_KEYWORDS, text, 1)
+
+    def _detect_prechecked_consent(self, checkboxes: List[CheckboxContext], page: CrawledPage) -> List[Finding]:
         """Detect pre-checked consent checkboxes."""
         findings = []
 
-        checkboxes = soup.find_all("input", {"type": "checkbox"})
-
-        for cb in checkboxes:
-            # Get associated label text
-            label_text = ""
-            label_id = cb.get("id")
-
-            if label_id:
-                label = soup.find("label", {"for": label_id})
-                if label:
-                    label_text = label.get_text().lower()
-
-            # Also check parent text
-            parent_text = cb.parent.get_text().lower() if cb.parent else ""
-            combined_text = label_text + " " + parent_text
+        for context in checkboxes:
+            cb = context.element
+            label_id = context.element_id
+            label_text = context.label_text
+            parent_text = context.parent_text
+            combined_text = context.combined_text
 
             # Check if consent-related
-            is_consent = any(kw in combined_text for kw in self.CONSENT_KEYWORDS)
+            is_consent = self._has_consent_keyword(combined_text)
 
             if is_consent:
                 # Check if pre-checked
@@ -176,40 +291,27 @@ class ConsentDetector(BaseDetector):
 
         return findings
 
-    def _detect_bundled_consent(self, soup: BeautifulSoup, page: CrawledPage) -> List[Finding]:
+    def _detect_bundled_consent(self, checkboxes: List[CheckboxContext], page: CrawledPage) -> List[Finding]:
         """Detect bundled/combined consent (multiple purposes in one checkbox)."""
         findings = []
 
-        checkboxes = soup.find_all("input", {"type": "checkbox"})
-
-        # Keywords that indicate different consent purposes
-        purpose_groups = [
-            ["marketing", "promotional", "newsletter", "offers"],
-            ["analytics", "tracking", "statistics"],
-            ["third party", "partner", "share"],
-            ["personalization", "recommendations"],
-        ]
-
-        for cb in checkboxes:
-            label_text = ""
-            label_id = cb.get("id")
-
-            if label_id:
-                label = soup.find("label", {"for": label_id})
-                if label:
-                    label_text = label.get_text().lower()
-
-            parent_text = cb.parent.get_text().lower() if cb.parent else ""
-            combined_text = label_text + " " + parent_text
+        for context in checkboxes:
+            cb = context.element
+            label_id = context.element_id
+            combined_text = context.combined_text
 
             # Count how many purpose groups are mentioned
             matched_groups = 0
             matched_purposes = []
 
-            for group in purpose_groups:
-                if any(kw in combined_text for kw in group):
+            purpose_hits = find_group_keywords(
+                self._purpose_automaton, self.PURPOSE_GROUPS, combined_text
+            )
+            for group, keywords in self.PURPOSE_GROUPS.items():
+                hits = purpose_hits[group]
+                if hits:
                     matched_groups += 1
-                    matched_purposes.extend([kw for kw in group if kw in combined_text])
+                    matched_purposes.extend([kw for kw in keywords if kw in hits])
 
             if matched_groups >= 2:
                 # Visual representation
@@ -287,38 +389,26 @@ class ConsentDetector(BaseDetector):
 
         return findings
 
-    def _detect_hidden_consent(self, soup: BeautifulSoup, page: CrawledPage) -> List[Finding]:
+    def _detect_hidden_consent(self, checkboxes: List[CheckboxContext], page: CrawledPage) -> List[Finding]:
         """Detect hidden or difficult-to-find consent elements."""
         findings = []
 
         # Find consent checkboxes that may be hidden
-        checkboxes = soup.find_all("input", {"type": "checkbox"})
-
-        for cb in checkboxes:
+        for context in checkboxes:
+            cb = context.element
             style = cb.get("style", "")
             class_attr = cb.get("class", [])
             class_str = " ".join(class_attr) if isinstance(class_attr, list) else str(class_attr)
 
-            # Check for hidden styles
-            hidden_indicators = [
-                "display:none", "display: none",
-                "visibility:hidden", "visibility: hidden",
-                "opacity:0", "opacity: 0",
-                "hidden",
-            ]
-
-            is_hidden = any(ind in style.lower() or ind in class_str.lower()
-                           for ind in hidden_indicators)
+            # Check for hidden styles; the newline keeps a match from
+            # spanning the style and class values
+            is_hidden = self.HIDDEN_STYLE_RE.search(f"{style}\n{class_str}".lower()) is not None
 
             if is_hidden:
-                label_text = ""
-                label_id = cb.get("id")
-                if label_id:
-                    label = soup.find("label", {"for": label_id})
-                    if label:
-                        label_text = label.get_text().lower()
-
-                if any(kw in label_text for kw in self.CONSENT_KEYWORDS):
+                label_id = context.element_id
+                label_text = context.label_text
+
+                if self._has_consent_keyword(label_text):
                     findings.append(Finding(
                         check_type=CheckType.DARK_PATTERN_HIDDEN_OPTION,
                         severity=FindingSeverity.CRITICAL,
@@ -336,23 +426,24 @@ class ConsentDetector(BaseDetector):
     def _detect_withdrawal_issues(self, soup: BeautifulSoup, page: CrawledPage) -> List[Finding]:
         """Check for consent withdrawal mechanism."""
         findings = []
-        text_content = soup.get_text().lower()
 
-        # Keywords for withdrawal mechanism
-        withdrawal_keywords = [
-            "withdraw consent", "revoke consent", "opt out", "opt-out",
-            "unsubscribe", "manage preferences", "privacy settings",
-            "सहमति वापस", "ऑप्ट आउट", "अनसब्सक्राइब",
-        ]
-
-        has_withdrawal = any(kw in text_content for kw in withdrawal_keywords)
-
-        # Check if this appears to be a form page with consent
-        consent_form = soup.find("form") if any(
-            kw in text_content for kw in self.CONSENT_KEYWORDS
-        ) else None
-
-        if consent_form and not has_withdrawal:
+        # Only form pages collect consent; look for the form before reading
+        # any text
+        consent_form = soup.find("form")
+        if consent_form is None:
+            return findings
+
+        # Shared with the other detectors through the page's cache
+        text_content = page.get_lower_text(soup)
+
+        # Check if this appears to be a form page with consent, then whether
+        # withdrawal is offered
+        if (
+            self._has_consent_keyword(text_content)
+            and not has_keywords(
+                self._withdrawal_automaton, self.WITHDRAWAL_KEYWORDS, text_content, 1
+            )
+        ):
             visual_content = [
                 "CONSENT WITHDRAWAL MECHANISM MISSING",
                 "",
@@ -380,7 +471,7 @@ class ConsentDetector(BaseDetector):
                 remediation="Add clear information about how users can withdraw their consent at any time.",
                 extra_data={
                     "violation_type": "missing_withdrawal_mechanism",
-                    "keywords_searched": withdrawal_keywords[:5],
+                    "keywords_searched": self.WITHDRAWAL_KEYWORDS[:5],
                     "penalty_risk": "₹50 crore",
                     "visual_representation": visual_box,
                     "code_fix_example": '''
@@ -426,14 +517,16 @@ class ConsentDetector(BaseDetector):
 
         # Check cookie consent elements
         for element in page.consent_elements:
-            if element.get("type") == "banner":
+            element_type = element.get("type")
+            if element_type == "banner":
                 banner_text = element.get("text", "").lower()
 
-                # Check for accept-only option (no reject)
-                has_accept = "accept" in banner_text or "agree" in banner_text
-                has_reject = "reject" in banner_text or "decline" in banner_text or "refuse" in banner_text
-
-                if has_accept and not has_reject:
+                # Check for accept-only option (no reject); the reject
+                # wording is only searched for banners offering accept
+                if (
+                    self.BANNER_ACCEPT_RE.search(banner_text) is not None
+                    and self.BANNER_REJECT_RE.search(banner_text) is None
+                ):
                     visual_content = [
                         "COOKIE BANNER - NO REJECT OPTION",
                         "",
@@ -498,7 +591,7 @@ class ConsentDetector(BaseDetector):
                         }
                     ))
 
-            elif element.get("type") == "checkbox":
+            elif element_type == "checkbox":
                 if element.get("preChecked"):
                     checkbox_label = element.get('label', '')[:100]
                     visual_content = [
@@ -6,10 +6,11 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.core.database import close_db, init_db
+from app.core.websocket import scan_event_subscriber
 from app.api.v1.router import api_router
 
 
@@ -23,11 +24,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     await init_db()
     print("Database initialized")
+    await scan_event_subscriber.start(settings.REDIS_URL)
 
     yield
 
     # Shutdown
     print("Shutting down...")
+    await scan_event_subscriber.stop()
     await close_db()
     print("Database connections closed")
 
@@ -64,6 +67,7 @@ app = FastAPI(
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -104,7 +108,7 @@ async def health_check():
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "detail": "Internal server error",
@@ -1,17 +1,35 @@
 """
 DPDP GUI Compliance Scanner - Base Model Mixins
 """
+import sys
 import uuid
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, String, func
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
 
 
+class InternedString(TypeDecorator):
+    """
+    String column whose loaded values are interned.
+
+    For low-cardinality values used as dict keys (e.g. DPDP section names),
+    rows share one str object per distinct value, so downstream lookups
+    compare by identity instead of character by character.
+    """
+
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value: Optional[str], dialect: Any) -> Optional[str]:
+        return sys.intern(value) if value is not None else None
+
+
 class TimestampMixin:
     """Mixin for created_at and updated_at timestamps."""
 
@@ -9,7 +9,7 @@ from sqlalchemy import Enum, ForeignKey, Numeric, String, Text, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, InternedString
 
 if TYPE_CHECKING:
     from app.models.scan import Scan
@@ -110,7 +110,7 @@ class Finding(BaseModel):
         Enum(CheckType),
         nullable=False
     )
-    dpdp_section: Mapped[Optional[str]] = mapped_column(String(50))  # e.g., "Section 5", "Section 6(6)"
+    dpdp_section: Mapped[Optional[str]] = mapped_column(InternedString(50))  # e.g., "Section 5", "Section 6(6)"
 
     # Result
     status: Mapped[FindingStatus] = mapped_column(
@@ -17,13 +17,20 @@ Features:
 import asyncio
 import random
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+from bs4 import BeautifulSoup
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright, TimeoutError as PlaywrightTimeout
 
 from app.core.config import settings
 
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 
 # Domains that typically need longer timeouts (government, large portals)
 SLOW_DOMAINS = [
@@ -40,6 +47,32 @@ WAIT_STRATEGIES = [
 ]
 
 
+# Nodes whose contents BeautifulSoup's get_text() leaves out
+_NON_TEXT_NODES = (
+    "script", "style", "template",
+    *((etree.Comment, etree.ProcessingInstruction) if LXML_AVAILABLE else ()),
+)
+
+
+def extract_text(html: str) -> str:
+    """
+    Get the text of an HTML document as BeautifulSoup's get_text() returns it.
+
+    Uses lxml directly when installed, which avoids building a BeautifulSoup
+    tree only to read the text back out of it.
+    """
+    if not LXML_AVAILABLE:
+        return BeautifulSoup(html, "html.parser").get_text()
+
+    parser = etree.HTMLParser()
+    parser.feed(html)
+    root = parser.close()
+    if root is None:
+        return ""
+    etree.strip_elements(root, *_NON_TEXT_NODES, with_tail=False)
+    return "".join(root.itertext())
+
+
 @dataclass
 class CrawledPage:
     """Represents a crawled web page."""
@@ -52,6 +85,23 @@ class CrawledPage:
     cookies: List[Dict] = field(default_factory=list)
     consent_elements: List[Dict] = field(default_factory=list)
     route_path: Optional[str] = None  # SPA route path
+    # Values derived from html_content (e.g. lowercased text) that detectors
+    # share so each page is only processed once per derivation
+    analysis_cache: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+
+    def get_lower_text(self, soup: Optional[BeautifulSoup] = None) -> str:
+        """
+        Get the page's visible text, lowercased, computing it at most once.
+
+        Args:
+            soup: Already-parsed, complete tree of html_content to extract from
+                on first use; without one the text is read via extract_text.
+        """
+        text = self.analysis_cache.get("lower_text")
+        if text is None:
+            raw_text = soup.get_text() if soup is not None else extract_text(self.html_content)
+            text = self.analysis_cache["lower_text"] = raw_text.lower()
+        return text
 
 
 class WebCrawler:
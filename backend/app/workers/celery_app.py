@@ -1,10 +1,23 @@
 """
 DPDP GUI Compliance Scanner - Celery Application Configuration
 """
+import asyncio
+
 from celery import Celery
 
 from app.core.config import settings
 
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Tasks run their coroutines (crawling, DB, Redis progress publishing) on
+# asyncio event loops; use libuv-backed loops where uvloop is installed
+if UVLOOP_AVAILABLE:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 celery_app = Celery(
     "dpdp_scanner",
     broker=settings.CELERY_BROKER_URL,
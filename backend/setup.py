@@ -0,0 +1,25 @@
+"""
+DPDP GUI Compliance Scanner - Optional native build
+
+Compiles hot, fully-annotated modules to C extensions with mypyc:
+
+    python setup.py build_ext --inplace
+
+The compiled extension is picked up in place of the .py module when present.
+Without this step (e.g. in development) the pure-Python modules are used
+unchanged.
+"""
+from setuptools import setup
+
+from mypyc.build import mypycify
+
+# Modules must type-check cleanly under mypy to compile
+MYPYC_MODULES = [
+    "app/core/scoring.py",
+]
+
+setup(
+    name="dpdp-compliance-backend",
+    packages=[],
+    ext_modules=mypycify(MYPYC_MODULES, opt_level="3"),
+)